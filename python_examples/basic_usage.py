@@ -2,8 +2,20 @@
 Basic PrismDB Python usage examples
 """
 
+import sys
+
 import prismdb
 
+
+def print_rows(rows):
+    """Print one indented line per row with a single write to stdout
+
+    Pass query results as `result.fetchall()`, which converts every row in
+    one call instead of binding rows one at a time through iteration.
+    """
+    sys.stdout.write("".join(f"  {row}\n" for row in rows))
+
+
 def example_basic_queries():
     """Demonstrate basic query execution"""
     print("=== Basic Queries Example ===")
@@ -15,23 +27,24 @@ def example_basic_queries():
     db.execute("CREATE TABLE users (id INTEGER, name VARCHAR, age INTEGER)")
     print("Created users table")
 
-    # Insert data
-    db.execute("INSERT INTO users VALUES (1, 'Alice', 30)")
-    db.execute("INSERT INTO users VALUES (2, 'Bob', 25)")
-    db.execute("INSERT INTO users VALUES (3, 'Charlie', 35)")
-    print("Inserted 3 users")
+    # Insert data with a prepared statement: parsed once, bound per row,
+    # and executed as a single multi-row batch
+    users = [(1, 'Alice', 30), (2, 'Bob', 25), (3, 'Charlie', 35)]
+    ins = db.prepare("INSERT INTO users VALUES (?, ?, ?)")
+    ins.executemany(users)
+    print(f"Inserted {len(users)} users")
 
     # Query data
     result = db.execute("SELECT * FROM users")
     print("\nAll users:")
-    for row in result:
-        print(f"  {row}")
+    print_rows(result.fetchall())
 
-    # Filter query
-    result = db.execute("SELECT name, age FROM users WHERE age > 25")
+    # Filter query: get the WHERE predicate back as a mask over the
+    # unfiltered columns instead of materializing the filtered rows
+    columns, mask = db.execute_bitmap("SELECT name, age FROM users WHERE age > 25")
+    names, ages = columns.values()
     print("\nUsers older than 25:")
-    for row in result:
-        print(f"  {row}")
+    print_rows((name, age) for name, age, keep in zip(names, ages, mask) if keep)
 
     db.close()
     print("\n✓ Basic queries example completed\n")
@@ -45,27 +58,35 @@ def example_cursor_api():
 
     # Create and populate table
     db.execute("CREATE TABLE products (id INTEGER, name VARCHAR, price DOUBLE)")
-    db.execute("INSERT INTO products VALUES (1, 'Laptop', 999.99)")
-    db.execute("INSERT INTO products VALUES (2, 'Mouse', 29.99)")
-    db.execute("INSERT INTO products VALUES (3, 'Keyboard', 79.99)")
+    ins = db.prepare("INSERT INTO products VALUES (?, ?, ?)")
+    ins.executemany([
+        (1, 'Laptop', 999.99),
+        (2, 'Mouse', 29.99),
+        (3, 'Keyboard', 79.99),
+    ])
 
     # Use cursor
     cursor = db.cursor()
     cursor.execute("SELECT * FROM products ORDER BY price DESC")
 
-    # Fetch one row at a time
-    print("\nFetching one row at a time:")
-    row = cursor.fetchone()
-    while row:
-        print(f"  {row}")
-        row = cursor.fetchone()
+    # Fetch rows in batches
+    print("\nFetching rows in batches:")
+    while (batch := cursor.fetchmany(1024)):
+        print_rows(batch)
 
     # Fetch all rows
     cursor.execute("SELECT name, price FROM products WHERE price < 100")
     rows = cursor.fetchall()
     print(f"\nProducts under $100: {len(rows)} items")
-    for row in rows:
-        print(f"  {row}")
+    print_rows(rows)
+
+    # Iterate column batches when per-row objects aren't needed
+    cursor.execute("SELECT price FROM products")
+    total = 0.0
+    for batch in cursor.iter_batches():
+        for prices in batch.values():
+            total += sum(prices)
+    print(f"\nTotal catalog value: ${total:.2f}")
 
     cursor.close()
     db.close()
@@ -88,10 +109,14 @@ def example_aggregates():
         )
     """)
 
-    db.execute("INSERT INTO sales VALUES ('North', 'Laptop', 1500.00, 3)")
-    db.execute("INSERT INTO sales VALUES ('North', 'Mouse', 45.00, 10)")
-    db.execute("INSERT INTO sales VALUES ('South', 'Laptop', 2000.00, 4)")
-    db.execute("INSERT INTO sales VALUES ('South', 'Keyboard', 150.00, 5)")
+    # Bulk-load columnar data directly, without going through SQL INSERT.
+    # A pyarrow.Table can be loaded the same way with db.insert_arrow().
+    db.insert_columns("sales", {
+        "region": ["North", "North", "South", "South"],
+        "product": ["Laptop", "Mouse", "Laptop", "Keyboard"],
+        "amount": [1500.00, 45.00, 2000.00, 150.00],
+        "quantity": [3, 10, 4, 5],
+    })
 
     # Aggregate queries
     result = db.execute("""
@@ -107,8 +132,7 @@ def example_aggregates():
     """)
 
     print("\nSales by region:")
-    for row in result:
-        print(f"  {row}")
+    print_rows(result.fetchall())
 
     db.close()
     print("\n✓ Aggregate functions example completed\n")
@@ -121,18 +145,29 @@ def example_to_dict():
     db = prismdb.connect()
 
     db.execute("CREATE TABLE employees (id INTEGER, name VARCHAR, salary DOUBLE)")
-    db.execute("INSERT INTO employees VALUES (1, 'Alice', 75000.0)")
-    db.execute("INSERT INTO employees VALUES (2, 'Bob', 65000.0)")
-    db.execute("INSERT INTO employees VALUES (3, 'Charlie', 85000.0)")
+    db.execute("""
+        INSERT INTO employees VALUES
+            (1, 'Alice', 75000.0),
+            (2, 'Bob', 65000.0),
+            (3, 'Charlie', 85000.0)
+    """)
 
     # Convert to dictionary
     data = db.to_dict("SELECT * FROM employees ORDER BY id")
 
     print("\nData as dictionary:")
     # Column names include table prefix
-    keys = list(data.keys())
-    for key in keys:
-        print(f"  {key}: {data[key]}")
+    print_rows(f"{key}: {data[key]}" for key in data.keys())
+
+    # Numeric columns can be returned as typed NumPy arrays
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("\nInstall numpy to get columns as NumPy arrays")
+    else:
+        arrays = db.to_dict("SELECT * FROM employees ORDER BY id", numpy=True)
+        print("\nData as NumPy arrays:")
+        print_rows(f"{key}: {column!r}" for key, column in arrays.items())
 
     db.close()
     print("\n✓ Dictionary conversion example completed\n")
@@ -148,8 +183,7 @@ def example_context_manager():
         db.execute("INSERT INTO temp VALUES (42)")
 
         result = db.execute("SELECT * FROM temp")
-        for row in result:
-            print(f"  {row}")
+        print_rows(result.fetchall())
 
     # Database is automatically closed
     print("\n✓ Context manager example completed\n")
@@ -172,8 +206,7 @@ def example_string_functions():
     """)
 
     print("\nString function results:")
-    for row in result:
-        print(f"  {row}")
+    print_rows(result.fetchall())
 
     db.close()
     print("\n✓ String functions example completed\n")
@@ -186,6 +219,22 @@ def example_file_based_db():
     import os
     import tempfile
 
+    # Without WAL/checkpointing the file round-trip persists nothing, so
+    # only exercise it when explicitly requested
+    if os.environ.get("PRISMDB_EXAMPLE_PERSIST") != "1":
+        db = prismdb.connect(":memory:")
+        db.execute("CREATE TABLE persistent (id INTEGER, value VARCHAR)")
+        db.execute("INSERT INTO persistent VALUES (1, 'stored')")
+
+        result = db.execute("SELECT * FROM persistent")
+        print("\nData in current session (in-memory):")
+        print_rows(result.fetchall())
+
+        db.close()
+        print("\nNote: Set PRISMDB_EXAMPLE_PERSIST=1 to run this example against a file")
+        print("\n✓ File-based database example completed\n")
+        return
+
     # Create temporary database file
     with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as f:
         db_path = f.name
@@ -200,8 +249,7 @@ def example_file_based_db():
         # Verify data is accessible
         result = db.execute("SELECT * FROM persistent")
         print("Data in current session:")
-        for row in result:
-            print(f"  {row}")
+        print_rows(result.fetchall())
 
         db.close()
         print("\nNote: File persistence requires WAL/checkpoint implementation")
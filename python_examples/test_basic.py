@@ -2,94 +2,177 @@
 Basic tests for PrismDB Python bindings
 """
 
-import prismdb
+import inspect
+import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import prismdb
+import pytest
+
+# Tables used by the tests. Each test drops and recreates the tables it uses
+# with recreate(), so it starts from empty tables whichever tests ran on the
+# connection before it.
+SCHEMAS = {
+    "people": "id INTEGER, name VARCHAR",
+    "measurements": "id INTEGER, value DOUBLE",
+    "numbers": "value INTEGER",
+}
+
+# Under run_all_tests() tests run concurrently; each worker thread opens one
+# connection on first use and reuses it for every test that thread runs.
+# Under pytest the module-scoped `db` fixture hands out the same connection.
+_worker = threading.local()
+
+
+def worker_connection():
+    """Return the calling thread's connection, opening it on first use"""
+    if not hasattr(_worker, "db"):
+        _worker.db = prismdb.connect()
+    return _worker.db
+
+
+@pytest.fixture(scope="module")
+def db():
+    """Connection shared by the tests in this module"""
+    return worker_connection()
+
+
+def run_test(test):
+    """Run `test`, passing the calling worker's connection if it takes `db`"""
+    if "db" in inspect.signature(test).parameters:
+        return test(worker_connection())
+    return test()
+
+
+def recreate(db, *tables):
+    """Drop and recreate `tables` from SCHEMAS
+
+    DELETE only marks rows as deleted, so dropping the table is what gives
+    the next test an empty one.
+    """
+    for table in tables:
+        db.execute(f"DROP TABLE IF EXISTS {table}")
+        db.execute(f"CREATE TABLE {table} ({SCHEMAS[table]})")
 
 
 def test_connection():
     """Test database connection"""
-    print("Testing connection...", end=" ")
-    db = prismdb.connect()
-    assert db is not None
-    db.close()
-    print("✓")
+    conn = prismdb.connect()
+    assert conn is not None
+    conn.close()
 
 
-def test_create_table():
+def test_create_table(db):
     """Test table creation"""
-    print("Testing CREATE TABLE...", end=" ")
-    db = prismdb.connect()
-    db.execute("CREATE TABLE test (id INTEGER, name VARCHAR)")
-    db.close()
-    print("✓")
+    recreate(db, *SCHEMAS)
+    for table in SCHEMAS:
+        count = db.scalar(f"SELECT COUNT(*) FROM {table}")
+        assert count == 0, f"Expected empty {table}, got {count} rows"
+
+    db.execute("CREATE TABLE scratch (id INTEGER)")
+    db.execute("DROP TABLE scratch")
 
 
-def test_insert():
+def test_insert(db):
     """Test INSERT operation"""
-    print("Testing INSERT...", end=" ")
-    db = prismdb.connect()
-    db.execute("CREATE TABLE test (id INTEGER, name VARCHAR)")
-    db.execute("INSERT INTO test VALUES (1, 'Alice')")
-    db.execute("INSERT INTO test VALUES (2, 'Bob')")
+    recreate(db, "people")
+    ins = db.prepare("INSERT INTO people VALUES (?, ?)")
+    assert ins.parameter_count == 2, f"Expected 2 parameters, got {ins.parameter_count}"
+    ins.executemany([(1, 'Alice')])
+    ins.execute((2, 'Bob'))
+
+    count = db.scalar("SELECT COUNT(*) FROM people")
+    assert count == 2, f"Expected 2 rows, got {count}"
 
-    result = db.execute("SELECT COUNT(*) FROM test")
-    row = result.fetchone()
-    assert row[0] == 2, f"Expected 2 rows, got {row[0]}"
-    db.close()
-    print("✓")
 
+def test_executemany(db):
+    """Test parameterized batch INSERT"""
+    recreate(db, "people")
+    db.executemany("INSERT INTO people VALUES (?, ?)", [(1, 'Alice'), (2, "O'Brien"), (3, None)])
 
-def test_select():
+    rows = db.execute("SELECT * FROM people ORDER BY id").fetchall()
+    assert len(rows) == 3, f"Expected 3 rows, got {len(rows)}"
+    assert rows[1][1] == "O'Brien", f"Expected \"O'Brien\", got {rows[1][1]}"
+    assert rows[2][1] is None, f"Expected None, got {rows[2][1]}"
+
+    name = db.scalar("SELECT name FROM people WHERE id = ?", (1,))
+    assert name == 'Alice', f"Expected 'Alice', got {name}"
+
+
+def test_insert_columns(db):
+    """Test columnar bulk load"""
+    recreate(db, "measurements")
+    inserted = db.insert_columns("measurements", {"id": [1, 2, 3], "value": [1.5, None, 3.5]})
+    assert inserted == 3, f"Expected 3 inserted rows, got {inserted}"
+
+    rows = db.execute("SELECT * FROM measurements ORDER BY id").fetchall()
+    assert rows == [[1, 1.5], [2, None], [3, 3.5]], f"Unexpected rows {rows}"
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None:
+        # int64 arrays are cast to the INTEGER column from the buffer
+        db.insert_columns("measurements", {"id": np.arange(4, 6), "value": np.array([4.5, 5.5])})
+        rows = db.execute("SELECT * FROM measurements WHERE id > 3 ORDER BY id").fetchall()
+        assert rows == [[4, 4.5], [5, 5.5]], f"Unexpected rows {rows}"
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        pa = None
+    if pa is not None:
+        db.insert_arrow("measurements", pa.table({"id": [6, 7], "value": [6.5, None]}))
+        rows = db.execute("SELECT * FROM measurements WHERE id > 5 ORDER BY id").fetchall()
+        assert rows == [[6, 6.5], [7, None]], f"Unexpected rows {rows}"
+
+
+def test_select(db):
     """Test SELECT query"""
-    print("Testing SELECT...", end=" ")
-    db = prismdb.connect()
-    db.execute("CREATE TABLE test (id INTEGER, value DOUBLE)")
-    db.execute("INSERT INTO test VALUES (1, 10.5)")
-    db.execute("INSERT INTO test VALUES (2, 20.5)")
+    recreate(db, "measurements")
+    db.execute("INSERT INTO measurements VALUES (1, 10.5), (2, 20.5)")
 
-    result = db.execute("SELECT * FROM test ORDER BY id")
+    result = db.execute("SELECT * FROM measurements ORDER BY id")
     rows = result.fetchall()
 
     assert len(rows) == 2, f"Expected 2 rows, got {len(rows)}"
     assert rows[0][0] == 1, f"Expected id=1, got {rows[0][0]}"
-    db.close()
-    print("✓")
 
 
-def test_cursor():
+def test_cursor(db):
     """Test cursor API"""
-    print("Testing cursor API...", end=" ")
-    db = prismdb.connect()
-    db.execute("CREATE TABLE test (value INTEGER)")
-    db.execute("INSERT INTO test VALUES (1)")
-    db.execute("INSERT INTO test VALUES (2)")
-    db.execute("INSERT INTO test VALUES (3)")
+    recreate(db, "numbers")
+    db.execute("INSERT INTO numbers VALUES (1), (2), (3)")
 
     cursor = db.cursor()
-    cursor.execute("SELECT * FROM test")
+    cursor.execute("SELECT * FROM numbers")
 
     # Test fetchone
     row1 = cursor.fetchone()
     assert row1 is not None
 
+    # Test fetchmany continues from the current position
+    batch = cursor.fetchmany(1)
+    assert len(batch) == 1, f"Expected 1 row, got {len(batch)}"
+    batch = cursor.fetchmany(1024)
+    assert len(batch) == 1, f"Expected 1 remaining row, got {len(batch)}"
+    assert cursor.fetchmany(1024) == [], "Expected no rows after exhausting cursor"
+
     # Test fetchall
-    cursor.execute("SELECT * FROM test")
+    cursor.execute("SELECT * FROM numbers")
     rows = cursor.fetchall()
     assert len(rows) == 3, f"Expected 3 rows, got {len(rows)}"
 
     cursor.close()
-    db.close()
-    print("✓")
 
 
-def test_aggregates():
+def test_aggregates(db):
     """Test aggregate functions"""
-    print("Testing aggregate functions...", end=" ")
-    db = prismdb.connect()
-    db.execute("CREATE TABLE numbers (value INTEGER)")
-    db.execute("INSERT INTO numbers VALUES (10)")
-    db.execute("INSERT INTO numbers VALUES (20)")
-    db.execute("INSERT INTO numbers VALUES (30)")
+    recreate(db, "numbers")
+    db.execute("INSERT INTO numbers VALUES (10), (20), (30)")
 
     result = db.execute("SELECT SUM(value), AVG(value), MIN(value), MAX(value), COUNT(*) FROM numbers")
     row = result.fetchone()
@@ -99,38 +182,27 @@ def test_aggregates():
     assert row[3] == 30, f"Expected MAX=30, got {row[3]}"
     assert row[4] == 3, f"Expected COUNT=3, got {row[4]}"
 
-    db.close()
-    print("✓")
+    count = db.scalar("SELECT COUNT(*) FROM numbers")
+    assert count == 3, f"Expected COUNT=3, got {count}"
 
 
-def test_string_functions():
+def test_string_functions(db):
     """Test string functions"""
-    print("Testing string functions...", end=" ")
-    db = prismdb.connect()
+    upper = db.scalar("SELECT UPPER('hello') as upper_test")
+    assert upper == 'HELLO', f"Expected 'HELLO', got {upper}"
 
-    result = db.execute("SELECT UPPER('hello') as upper_test")
-    row = result.fetchone()
-    assert row[0] == 'HELLO', f"Expected 'HELLO', got {row[0]}"
-
-    result = db.execute("SELECT LOWER('WORLD') as lower_test")
-    row = result.fetchone()
-    assert row[0] == 'world', f"Expected 'world', got {row[0]}"
-
-    db.close()
-    print("✓")
+    lower = db.scalar("SELECT LOWER('WORLD') as lower_test")
+    assert lower == 'world', f"Expected 'world', got {lower}"
 
 
-def test_to_dict():
+def test_to_dict(db):
     """Test to_dict conversion"""
-    print("Testing to_dict...", end=" ")
-    db = prismdb.connect()
-    db.execute("CREATE TABLE test (id INTEGER, name VARCHAR)")
-    db.execute("INSERT INTO test VALUES (1, 'Alice')")
-    db.execute("INSERT INTO test VALUES (2, 'Bob')")
+    recreate(db, "people")
+    db.execute("INSERT INTO people VALUES (1, 'Alice'), (2, 'Bob')")
 
-    data = db.to_dict("SELECT * FROM test ORDER BY id")
+    data = db.to_dict("SELECT * FROM people ORDER BY id")
 
-    # Column names include table prefix (test.id, test.name)
+    # Column names include table prefix (people.id, people.name)
     keys = list(data.keys())
     assert len(keys) == 2, f"Expected 2 columns, got {len(keys)}"
     assert any('id' in k for k in keys), "Expected 'id' column in dict"
@@ -143,40 +215,98 @@ def test_to_dict():
     assert data[id_col] == [1, 2], f"Expected [1, 2], got {data[id_col]}"
     assert data[name_col] == ['Alice', 'Bob'], f"Expected ['Alice', 'Bob'], got {data[name_col]}"
 
-    db.close()
-    print("✓")
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None:
+        arrays = db.to_dict("SELECT * FROM people ORDER BY id", numpy=True)
+        assert isinstance(arrays[id_col], np.ndarray), f"Expected ndarray, got {type(arrays[id_col])}"
+        assert arrays[id_col].dtype == np.int64, f"Expected int64, got {arrays[id_col].dtype}"
+        assert arrays[id_col].tolist() == [1, 2], f"Expected [1, 2], got {arrays[id_col]}"
+        assert arrays[name_col].tolist() == ['Alice', 'Bob'], f"Expected ['Alice', 'Bob'], got {arrays[name_col]}"
 
 
 def test_context_manager():
     """Test context manager"""
-    print("Testing context manager...", end=" ")
-    with prismdb.connect() as db:
-        db.execute("CREATE TABLE test (value INTEGER)")
-        db.execute("INSERT INTO test VALUES (42)")
-        result = db.execute("SELECT * FROM test")
-        row = result.fetchone()
-        assert row[0] == 42
-    print("✓")
+    with prismdb.connect() as conn:
+        conn.execute("CREATE TABLE test (value INTEGER)")
+        conn.execute("INSERT INTO test VALUES (42)")
+        assert conn.scalar("SELECT * FROM test") == 42
 
 
-def test_iterator():
+def test_iterator(db):
     """Test iterator protocol"""
-    print("Testing iterator protocol...", end=" ")
-    db = prismdb.connect()
-    db.execute("CREATE TABLE test (value INTEGER)")
-    db.execute("INSERT INTO test VALUES (1)")
-    db.execute("INSERT INTO test VALUES (2)")
-    db.execute("INSERT INTO test VALUES (3)")
-
-    result = db.execute("SELECT * FROM test")
+    recreate(db, "numbers", "people")
+    db.execute("INSERT INTO numbers VALUES (1), (2), (3)")
+
+    result = db.execute("SELECT * FROM numbers")
     count = 0
     for row in result:
         count += 1
         assert row[0] in [1, 2, 3]
 
     assert count == 3, f"Expected 3 iterations, got {count}"
-    db.close()
-    print("✓")
+
+    # VARCHAR rows spanning several chunks, fetched one at a time
+    ids = list(range(5000))
+    db.insert_columns("people", {"id": ids, "name": [f"name{i % 7}" for i in ids]})
+    rows = list(db.execute("SELECT * FROM people ORDER BY id"))
+    assert len(rows) == 5000, f"Expected 5000 rows, got {len(rows)}"
+    assert all(row[1] == f"name{row[0] % 7}" for row in rows), "Names should stay with their rows"
+
+
+def test_iter_batches(db):
+    """Test column batch iteration"""
+    recreate(db, "numbers")
+    db.insert_columns("numbers", {"value": list(range(2500))})
+
+    result = db.execute("SELECT * FROM numbers ORDER BY value")
+    sizes = []
+    values = []
+    for batch in result.iter_batches(size=1000):
+        column, = batch.values()
+        sizes.append(len(column))
+        values.extend(column)
+
+    assert sizes == [1000, 1000, 500], f"Expected [1000, 1000, 500], got {sizes}"
+    assert values == list(range(2500)), "Batches should cover every row in order"
+
+    cursor = db.cursor()
+    cursor.execute("SELECT * FROM numbers WHERE value < 10")
+    batches = list(cursor.iter_batches())
+    assert len(batches) == 1, f"Expected 1 batch, got {len(batches)}"
+
+
+def test_execute_bitmap(db):
+    """Test returning a WHERE predicate as a row mask"""
+    recreate(db, "numbers")
+    db.insert_columns("numbers", {"value": list(range(10))})
+
+    columns, mask = db.execute_bitmap("SELECT value FROM numbers WHERE value > 6")
+    values, = columns.values()
+    assert len(values) == 10, f"Expected all 10 rows, got {len(values)}"
+    assert len(mask) == 10, f"Expected 10 mask entries, got {len(mask)}"
+    selected = sorted(v for v, keep in zip(values, mask) if keep)
+    assert selected == [7, 8, 9], f"Expected [7, 8, 9], got {selected}"
+
+
+def test_concurrent_queries():
+    """Test queries running concurrently on separate connections"""
+
+    def run_query(n):
+        conn = prismdb.connect()
+        conn.execute("CREATE TABLE test (value INTEGER)")
+        conn.insert_columns("test", {"value": list(range(n * 1000))})
+        total = conn.scalar("SELECT SUM(value) FROM test WHERE value >= 0")
+        conn.close()
+        return total
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        totals = list(pool.map(run_query, range(1, 9)))
+
+    expected = [sum(range(n * 1000)) for n in range(1, 9)]
+    assert totals == expected, f"Expected {expected}, got {totals}"
 
 
 def run_all_tests():
@@ -190,6 +320,8 @@ def run_all_tests():
         test_connection,
         test_create_table,
         test_insert,
+        test_executemany,
+        test_insert_columns,
         test_select,
         test_cursor,
         test_aggregates,
@@ -197,16 +329,25 @@ def run_all_tests():
         test_to_dict,
         test_context_manager,
         test_iterator,
+        test_iter_batches,
+        test_execute_bitmap,
+        test_concurrent_queries,
     ]
 
     failed = []
 
-    for test in tests:
-        try:
-            test()
-        except Exception as e:
-            print(f"✗ FAILED: {e}")
-            failed.append((test.__name__, str(e)))
+    # Report each test as it completes
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        futures = {pool.submit(run_test, test): test for test in tests}
+        for future in as_completed(futures):
+            name = futures[future].__name__
+            try:
+                future.result()
+            except Exception as e:
+                print(f"{name}... ✗ FAILED: {e}")
+                failed.append((name, str(e)))
+            else:
+                print(f"{name}... ✓")
 
     print()
     print("=" * 50)
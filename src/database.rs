@@ -3,19 +3,19 @@
 //! This module provides the main Database struct that ties together
 //! all components: catalog, storage, transactions, parser, planner, and executor.
 
-use crate::catalog::Catalog;
+use crate::catalog::{Catalog, Table};
 use crate::common::error::{PrismDBError, PrismDBResult};
-use crate::execution::{CollectedResult, ExecutionContext, ExecutionEngine, ExecutionStats};
+use crate::execution::{CollectedResult, ExecutionContext, ExecutionEngine, ExecutionStats, ParallelContext};
 use crate::extensions::{ConfigManager, ExtensionManager, SecretsManager};
 use crate::extensions::csv_reader::CsvReader;
 use crate::extensions::file_reader::FileReader;
 use crate::extensions::json_reader::JsonReader;
 use crate::extensions::parquet_reader::ParquetReader;
 use crate::extensions::sqlite_reader::SqliteReader;
-use crate::parser::{tokenizer::Tokenizer, Parser, Statement, SetValue, TableReference, Expression, SelectStatement};
+use crate::parser::{tokenizer::Tokenizer, Parser, Statement, StatementCache, SetValue, TableReference, Expression, SelectStatement, InsertSource, InsertStatement, QueryParameters};
 use crate::planner::{LogicalPlan, QueryOptimizer, QueryPlanner};
-use crate::storage::{BlockManager, TransactionManager};
-use crate::types::{DataChunk, LogicalType, Value};
+use crate::storage::{BlockManager, ColumnInfo, TransactionManager};
+use crate::types::{DataChunk, LogicalType, Value, Vector};
 use std::path::Path;
 use std::sync::{Arc, RwLock};
 
@@ -35,8 +35,11 @@ pub struct Database {
     /// Secrets manager
     secrets_manager: Arc<SecretsManager>,
     /// Database configuration
-    #[allow(dead_code)]
     config: DatabaseConfig,
+    /// Worker pool for query execution (None uses the global rayon pool)
+    thread_pool: Option<Arc<rayon::ThreadPool>>,
+    /// Parsed statements, keyed by SQL text
+    statement_cache: Arc<StatementCache>,
 }
 
 impl Database {
@@ -57,6 +60,8 @@ impl Database {
             config_manager,
             secrets_manager,
             config,
+            thread_pool: None,
+            statement_cache: Arc::new(StatementCache::in_memory()),
         })
     }
 
@@ -91,6 +96,8 @@ impl Database {
             config_manager: Arc::new(ConfigManager::new()),
             secrets_manager: Arc::new(SecretsManager::new()),
             config,
+            thread_pool: None,
+            statement_cache: Arc::new(StatementCache::in_memory()),
         })
     }
 
@@ -114,34 +121,47 @@ impl Database {
 
     /// Execute a SQL query and collect results
     pub fn execute_sql_collect(&self, sql: &str) -> PrismDBResult<QueryResult> {
-        // Tokenize the SQL
-        let tokenizer = Tokenizer::new();
-        let tokens = tokenizer.tokenize(sql)?;
-
-        // Parse the SQL
-        let mut parser = Parser::new(tokens);
-        let statements = parser.parse_statements()?;
-
-        if statements.is_empty() {
-            return Ok(QueryResult::empty());
-        }
+        let statements = self.parse_sql_cached(sql)?;
 
         // Execute all statements but return only the last result
         let mut last_result = QueryResult::empty();
-        for (idx, statement) in statements.iter().enumerate() {
-            let _is_last = idx == statements.len() - 1;
+        for statement in statements.iter() {
+            last_result = self.execute_statement(statement)?;
+        }
+
+        Ok(last_result)
+    }
+
+    /// Tokenize and parse a SQL string into statements
+    ///
+    /// Results are served from the statement cache when the same SQL text
+    /// has been parsed before.
+    pub fn parse_sql(&self, sql: &str) -> PrismDBResult<Vec<Statement>> {
+        Ok(self.parse_sql_cached(sql)?.as_ref().clone())
+    }
+
+    /// Parse a SQL string, sharing the statement cache's copy of the result
+    fn parse_sql_cached(&self, sql: &str) -> PrismDBResult<Arc<Vec<Statement>>> {
+        self.statement_cache.get_or_parse(sql, |sql| {
+            let tokenizer = Tokenizer::new();
+            let tokens = tokenizer.tokenize(sql)?;
 
+            let mut parser = Parser::new(tokens);
+            parser.parse_statements()
+        })
+    }
+
+    /// Execute a single parsed statement
+    pub fn execute_statement(&self, statement: &Statement) -> PrismDBResult<QueryResult> {
         // Handle special statements that don't require planning/execution
         match statement {
             Statement::Install(install) => {
                 self.extension_manager.install(&install.extension_name)?;
-                last_result = QueryResult::empty();
-                continue;
+                return Ok(QueryResult::empty());
             }
             Statement::Load(load) => {
                 self.extension_manager.load(&load.extension_name)?;
-                last_result = QueryResult::empty();
-                continue;
+                return Ok(QueryResult::empty());
             }
             Statement::Set(set) => {
                 let value_str = match &set.value {
@@ -151,8 +171,7 @@ impl Database {
                     SetValue::Default => "DEFAULT".to_string(),
                 };
                 self.config_manager.set(&set.variable, value_str);
-                last_result = QueryResult::empty();
-                continue;
+                return Ok(QueryResult::empty());
             }
             Statement::CreateSecret(secret) => {
                 self.secrets_manager.create_secret(
@@ -161,14 +180,12 @@ impl Database {
                     secret.options.clone(),
                     secret.or_replace,
                 )?;
-                last_result = QueryResult::empty();
-                continue;
+                return Ok(QueryResult::empty());
             }
             Statement::Select(select) => {
                 // Check if this is a simple table function call
                 if let Some(result) = self.try_execute_table_function(select)? {
-                    last_result = result;
-                    continue;
+                    return Ok(result);
                 }
             }
             _ => {}
@@ -178,12 +195,187 @@ impl Database {
         let (logical_plan, ctes) = self.plan_statement(statement)?;
 
         // Execute the plan with CTEs (optimization happens inside execute_plan)
-        last_result = self.execute_plan(logical_plan, ctes)?;
+        self.execute_plan(logical_plan, ctes)
+    }
+
+    /// Execute a parameterized statement once for each parameter set
+    ///
+    /// `INSERT ... VALUES` statements are expanded into a single multi-row
+    /// insert, so the whole batch is planned and executed once. Other
+    /// statements are bound and executed per parameter set, returning the
+    /// last result.
+    pub fn execute_statement_batch(
+        &self,
+        statement: &Statement,
+        param_sets: &[QueryParameters],
+    ) -> PrismDBResult<QueryResult> {
+        if param_sets.is_empty() {
+            return Ok(QueryResult::empty());
         }
 
+        if let Statement::Insert(insert) = statement {
+            if let InsertSource::Values(rows) = &insert.source {
+                let mut batch_rows = Vec::with_capacity(rows.len() * param_sets.len());
+                for params in param_sets {
+                    let bound = statement.bind_parameters(params)?;
+                    if let Statement::Insert(InsertStatement {
+                        source: InsertSource::Values(bound_rows),
+                        ..
+                    }) = bound
+                    {
+                        batch_rows.extend(bound_rows);
+                    }
+                }
+
+                let mut batch = insert.clone();
+                batch.source = InsertSource::Values(batch_rows);
+                return self.execute_statement(&Statement::Insert(batch));
+            }
+        }
+
+        let mut last_result = QueryResult::empty();
+        for params in param_sets {
+            last_result = self.execute_statement(&statement.bind_parameters(params)?)?;
+        }
         Ok(last_result)
     }
 
+    /// Execute a filtered SELECT, returning its unfiltered rows and a row mask
+    ///
+    /// The WHERE predicate is evaluated over the scanned rows as an extra
+    /// output column instead of being applied as a filter, so no filtered
+    /// copy of the rows is built. The returned mask has one entry per row:
+    /// true where the predicate is TRUE, false where it is FALSE or NULL.
+    /// `sql` must be a single plain SELECT; DISTINCT, GROUP BY, HAVING,
+    /// QUALIFY, ORDER BY, LIMIT, OFFSET, set operations, and aggregate or
+    /// window functions in the select list all depend on which rows pass the
+    /// filter and are rejected.
+    pub fn execute_bitmap(&self, sql: &str) -> PrismDBResult<(QueryResult, Vec<bool>)> {
+        use crate::parser::ast::SelectItem;
+        use crate::planner::Binder;
+
+        let statements = self.parse_sql_cached(sql)?;
+        let select = match statements.as_slice() {
+            [Statement::Select(select)] => select,
+            _ => {
+                return Err(PrismDBError::InvalidArgument(
+                    "execute_bitmap requires exactly one SELECT statement".to_string(),
+                ))
+            }
+        };
+        if select.distinct
+            || !select.group_by.is_empty()
+            || select.having.is_some()
+            || select.qualify.is_some()
+            || !select.order_by.is_empty()
+            || select.limit.is_some()
+            || select.offset.is_some()
+            || !select.set_operations.is_empty()
+        {
+            return Err(PrismDBError::InvalidArgument(
+                "execute_bitmap does not support DISTINCT, GROUP BY, HAVING, QUALIFY, \
+                 ORDER BY, LIMIT, OFFSET or set operations"
+                    .to_string(),
+            ));
+        }
+
+        let mut base = select.clone();
+        for item in &mut base.select_list {
+            let expr = match item {
+                SelectItem::Expression(expr) => expr,
+                SelectItem::Alias(expr, _) => expr.as_mut(),
+                _ => continue,
+            };
+            expr.visit_mut(&mut |expr| {
+                let depends_on_filter = match expr {
+                    Expression::AggregateFunction { .. } | Expression::WindowFunction { .. } => true,
+                    Expression::FunctionCall { name, .. } => Binder::is_aggregate_function(name),
+                    _ => false,
+                };
+                if depends_on_filter {
+                    return Err(PrismDBError::InvalidArgument(
+                        "execute_bitmap does not support aggregate or window functions".to_string(),
+                    ));
+                }
+                Ok(())
+            })?;
+        }
+
+        let predicate = match base.where_clause.take() {
+            Some(predicate) => predicate,
+            None => {
+                let result = self.execute_statement(&Statement::Select(base))?;
+                let mask = vec![true; result.row_count()];
+                return Ok((result, mask));
+            }
+        };
+        base.select_list
+            .push(SelectItem::Alias(predicate, "__prismdb_mask__".to_string()));
+
+        let mut result = self.execute_statement(&Statement::Select(base))?;
+        let mask_column = result.columns.len().saturating_sub(1);
+        result.columns.truncate(mask_column);
+
+        let mut mask = Vec::with_capacity(result.row_count());
+        for chunk in result.chunks.iter_mut() {
+            let vector = chunk.remove_vector(mask_column).ok_or_else(|| {
+                PrismDBError::Internal("Filter mask column missing from result".to_string())
+            })?;
+            match (vector.get_type(), vector.fixed_width_data()) {
+                (LogicalType::Boolean, Some(data)) => mask.extend(
+                    data.iter()
+                        .enumerate()
+                        .map(|(row, &byte)| byte != 0 && vector.is_valid(row)),
+                ),
+                _ => {
+                    for row in 0..vector.len() {
+                        mask.push(vector.get_value(row)? == Value::Boolean(true));
+                    }
+                }
+            }
+        }
+        Ok((result, mask))
+    }
+
+    /// Look up a table in the default schema
+    fn get_table(&self, table_name: &str) -> PrismDBResult<Arc<RwLock<Table>>> {
+        let catalog = self
+            .catalog
+            .read()
+            .map_err(|_| PrismDBError::Internal("Failed to lock catalog".to_string()))?;
+        let schema_arc = catalog.get_default_schema();
+        let schema = schema_arc
+            .read()
+            .map_err(|_| PrismDBError::Internal("Failed to lock schema".to_string()))?;
+        schema.get_table(table_name)
+    }
+
+    /// Get the column definitions of a table
+    pub fn get_table_columns(&self, table_name: &str) -> PrismDBResult<Vec<ColumnInfo>> {
+        let table_arc = self.get_table(table_name)?;
+        let table = table_arc
+            .read()
+            .map_err(|_| PrismDBError::Internal("Failed to lock table".to_string()))?;
+        Ok(table.get_columns().to_vec())
+    }
+
+    /// Append column-oriented data directly to a table
+    ///
+    /// `columns` must contain one vector per table column, in table order.
+    /// This bypasses SQL parsing, planning and per-row value extraction.
+    pub fn append_columns(&self, table_name: &str, columns: Vec<Vec<Value>>) -> PrismDBResult<usize> {
+        let table_arc = self.get_table(table_name)?;
+        let table_data_arc = table_arc
+            .read()
+            .map_err(|_| PrismDBError::Internal("Failed to lock table".to_string()))?
+            .get_data();
+
+        let mut table_data = table_data_arc
+            .write()
+            .map_err(|_| PrismDBError::Internal("Failed to lock table data".to_string()))?;
+        table_data.append_columns(columns)
+    }
+
     /// Plan a SQL statement and return plan with CTEs
     fn plan_statement(&self, statement: &Statement) -> PrismDBResult<(LogicalPlan, std::collections::HashMap<String, LogicalPlan>)> {
         let mut planner = QueryPlanner::new_with_catalog(self.catalog.clone());
@@ -194,6 +386,12 @@ impl Database {
 
     /// Execute a logical plan
     fn execute_plan(&self, plan: LogicalPlan, ctes: std::collections::HashMap<String, LogicalPlan>) -> PrismDBResult<QueryResult> {
+        if ctes.is_empty() {
+            if let Some(result) = self.try_count_star(&plan)? {
+                return Ok(result);
+            }
+        }
+
         // Optimize and convert to physical plan with catalog/transaction context and CTEs
         let mut optimizer = QueryOptimizer::new()
             .with_context(self.catalog.clone(), self.transaction_manager.clone())
@@ -211,21 +409,24 @@ impl Database {
             .collect();
 
         // Create execution context
-        let context = ExecutionContext::new(self.transaction_manager.clone(), self.catalog.clone());
+        let mut context = ExecutionContext::new(self.transaction_manager.clone(), self.catalog.clone());
+        context.parallel_context = ParallelContext::new(self.config.threads);
 
-        // Execute the physical plan
-        let mut engine = ExecutionEngine::new(context);
-        let mut stream = engine.execute(physical_plan)?;
+        // Execute the physical plan and collect results on this database's workers
+        let (all_chunks, total_rows) = self.in_thread_pool(move || -> PrismDBResult<_> {
+            let mut engine = ExecutionEngine::new(context);
+            let mut stream = engine.execute(physical_plan)?;
 
-        // Collect results
-        let mut total_rows = 0;
-        let mut all_chunks = Vec::new();
+            let mut total_rows = 0;
+            let mut all_chunks = Vec::new();
 
-        while let Some(chunk_result) = stream.next() {
-            let chunk = chunk_result?;
-            total_rows += chunk.len();
-            all_chunks.push(chunk);
-        }
+            while let Some(chunk_result) = stream.next() {
+                let chunk = chunk_result?;
+                total_rows += chunk.len();
+                all_chunks.push(chunk);
+            }
+            Ok((all_chunks, total_rows))
+        })?;
 
         Ok(QueryResult {
             chunks: all_chunks,
@@ -234,6 +435,77 @@ impl Database {
         })
     }
 
+    /// Answer a bare `SELECT COUNT(*) FROM table` from the table's row count
+    ///
+    /// Returns `None` unless the plan is a single ungrouped, non-distinct
+    /// COUNT(*) over an unfiltered, unlimited table scan. In that case no
+    /// chunks are scanned and no rows are materialized.
+    fn try_count_star(&self, plan: &LogicalPlan) -> PrismDBResult<Option<QueryResult>> {
+        let proj = match plan {
+            LogicalPlan::Projection(proj) => proj,
+            _ => return Ok(None),
+        };
+        if proj.expressions.len() != 1
+            || !matches!(proj.expressions[0], Expression::ColumnReference { .. })
+        {
+            return Ok(None);
+        }
+        let agg = match proj.input.as_ref() {
+            LogicalPlan::Aggregate(agg) => agg,
+            _ => return Ok(None),
+        };
+        if !agg.group_by.is_empty() || agg.aggregates.len() != 1 {
+            return Ok(None);
+        }
+        let count = &agg.aggregates[0];
+        let is_count_star = count.function_name.eq_ignore_ascii_case("count")
+            && !count.distinct
+            && (count.arguments.is_empty()
+                || matches!(count.arguments.as_slice(), [Expression::Wildcard]));
+        if !is_count_star {
+            return Ok(None);
+        }
+        let scan = match agg.input.as_ref() {
+            LogicalPlan::TableScan(scan) => scan,
+            _ => return Ok(None),
+        };
+        if !scan.filters.is_empty() || scan.limit.is_some() {
+            return Ok(None);
+        }
+
+        // Unknown tables fall through to the regular path for its error message
+        let table_arc = match self.get_table(&scan.table_name) {
+            Ok(table_arc) => table_arc,
+            Err(_) => return Ok(None),
+        };
+        let table_data_arc = table_arc
+            .read()
+            .map_err(|_| PrismDBError::Internal("Failed to lock table".to_string()))?
+            .get_data();
+        let row_count = table_data_arc
+            .read()
+            .map_err(|_| PrismDBError::Internal("Failed to lock table data".to_string()))?
+            .row_count();
+
+        let mut chunk = DataChunk::new();
+        let mut count_vector = Vector::new(LogicalType::BigInt, 1);
+        count_vector.push(&Value::BigInt(row_count as i64))?;
+        chunk.add_vector(count_vector)?;
+
+        Ok(Some(QueryResult {
+            chunks: vec![chunk],
+            row_count: 1,
+            columns: proj
+                .schema
+                .iter()
+                .map(|col| ColumnMetadata {
+                    name: col.name.clone(),
+                    data_type: col.data_type.clone(),
+                })
+                .collect(),
+        }))
+    }
+
     /// Try to execute a table function directly (bypassing planner)
     fn try_execute_table_function(&self, select: &SelectStatement) -> PrismDBResult<Option<QueryResult>> {
         // Check if this is a simple SELECT * FROM table_function(...) query
@@ -504,14 +776,50 @@ impl Database {
 
     /// Create a new database with configuration
     pub fn new(config: DatabaseConfig) -> PrismDBResult<Self> {
-        if let Some(ref file_path) = config.file_path {
+        let mut db = if let Some(ref file_path) = config.file_path {
             // Create file-based database
-            Self::open(file_path)
+            Self::open(file_path)?
         } else {
             // Create in-memory database
-            Self::new_in_memory()
+            Self::new_in_memory()?
+        };
+        db.thread_pool = Self::build_thread_pool(config.threads)?;
+        if let Some(ref directory) = config.plan_cache_dir {
+            db.statement_cache = Arc::new(StatementCache::persistent(directory)?);
+        }
+        db.config = config;
+        Ok(db)
+    }
+
+    /// Build a dedicated worker pool unless `threads` matches the global pool
+    fn build_thread_pool(threads: usize) -> PrismDBResult<Option<Arc<rayon::ThreadPool>>> {
+        if threads == 0 {
+            return Err(PrismDBError::InvalidValue(
+                "Number of threads must be at least 1".to_string(),
+            ));
+        }
+        if threads == rayon::current_num_threads() {
+            return Ok(None);
+        }
+        rayon::ThreadPoolBuilder::new()
+            .num_threads(threads)
+            .build()
+            .map(|pool| Some(Arc::new(pool)))
+            .map_err(|e| PrismDBError::Internal(format!("Failed to build thread pool: {}", e)))
+    }
+
+    /// Run `f` on this database's worker pool
+    fn in_thread_pool<T: Send, F: FnOnce() -> T + Send>(&self, f: F) -> T {
+        match self.thread_pool {
+            Some(ref pool) => pool.install(f),
+            None => f(),
         }
     }
+
+    /// Number of threads used for parallel query execution
+    pub fn threads(&self) -> usize {
+        self.config.threads
+    }
 }
 
 /// Column metadata
@@ -558,8 +866,12 @@ impl QueryResult {
     }
 
     /// Get the first value from the result
+    ///
+    /// Empty chunks are skipped: a parallel scan keeps one chunk per morsel,
+    /// including morsels where a filter removed every row.
     pub fn first_value(&self) -> Option<Value> {
-        self.chunks.first()
+        self.chunks.iter()
+            .find(|chunk| chunk.len() > 0)
             .and_then(|chunk| chunk.get_vector(0))
             .and_then(|vector| vector.get_value(0).ok())
     }
@@ -604,9 +916,9 @@ impl QueryResult {
     }
 
     /// Convert result to a formatted table string with color support
-    pub fn to_table_string(&self) -> String {
+    pub fn to_table_string(&self) -> PrismDBResult<String> {
         if self.chunks.is_empty() {
-            return String::new();
+            return Ok(String::new());
         }
 
         let mut output = String::new();
@@ -660,10 +972,8 @@ impl QueryResult {
             for row_idx in 0..chunk.len() {
                 for col_idx in 0..column_count {
                     if let Some(vector) = chunk.get_vector(col_idx) {
-                        if let Ok(value) = vector.get_value(row_idx) {
-                            let str_len = format_value(&value).len();
-                            column_widths[col_idx] = column_widths[col_idx].max(str_len);
-                        }
+                        let str_len = format_value(&vector.get_value(row_idx)?).len();
+                        column_widths[col_idx] = column_widths[col_idx].max(str_len);
                     }
                 }
             }
@@ -737,14 +1047,9 @@ impl QueryResult {
                 output.push('│');
                 output.push_str(RESET);
                 for col_idx in 0..column_count {
-                    let value_str = if let Some(vector) = chunk.get_vector(col_idx) {
-                        if let Ok(value) = vector.get_value(row_idx) {
-                            format_value(&value)
-                        } else {
-                            "NULL".to_string()
-                        }
-                    } else {
-                        "NULL".to_string()
+                    let value_str = match chunk.get_vector(col_idx) {
+                        Some(vector) => format_value(&vector.get_value(row_idx)?),
+                        None => "NULL".to_string(),
                     };
 
                     output.push_str(&format!(
@@ -780,7 +1085,7 @@ impl QueryResult {
         output.push_str(RESET);
         output.push('\n');
 
-        output
+        Ok(output)
     }
 }
 
@@ -887,6 +1192,8 @@ pub struct DatabaseConfig {
     pub enable_optimizer: bool,
     /// Enable write-ahead logging
     pub enable_wal: bool,
+    /// Directory parsed statements are persisted to (None keeps them in memory only)
+    pub plan_cache_dir: Option<String>,
 }
 
 impl DatabaseConfig {
@@ -915,6 +1222,7 @@ impl Default for DatabaseConfig {
             threads: num_cpus::get(),
             enable_optimizer: true,
             enable_wal: true,
+            plan_cache_dir: None,
         }
     }
 }
@@ -12,12 +12,14 @@
 //! - Cache-friendly: Partition sizes aligned with cache lines
 
 use crate::common::error::{PrismDBError, PrismDBResult};
-use crate::execution::{ExecutionContext, ParallelHashTable};
+use crate::execution::{ExecutionContext, ParallelHashTable, NUM_PARTITIONS};
 use crate::planner::{
     DataChunkStream, ExecutionOperator, PhysicalColumn, PhysicalHashJoin, PhysicalJoinType,
 };
 use crate::types::{DataChunk, Value, Vector};
 use rayon::prelude::*;
+use std::collections::HashMap;
+use std::hash::{BuildHasherDefault, Hash, Hasher};
 use std::sync::Arc;
 
 /// Serialize a Value to a string for hash key (without Display formatting which adds quotes)
@@ -314,23 +316,162 @@ impl ExecutionOperator for ParallelHashJoinOperator {
     }
 }
 
+/// Aggregate states for each group, keyed by the serialized group key
+///
+/// Keys carry their own hash, so the table reuses the hash that picked the
+/// key's partition instead of hashing the string again.
+type GroupTable = HashMap<
+    GroupKey,
+    Vec<Box<dyn crate::expression::AggregateState>>,
+    BuildHasherDefault<GroupKeyHasher>,
+>;
+
+/// Fixed seeds: every worker must map a key to the same partition
+static GROUP_KEY_STATE: ahash::RandomState = ahash::RandomState::with_seeds(0, 0, 0, 0);
+
+/// Serialized group key together with its hash
+#[derive(Debug, Clone, Default, PartialEq, Eq)]
+struct GroupKey {
+    hash: u64,
+    key: String,
+}
+
+impl GroupKey {
+    fn new(key: String) -> Self {
+        let hash = GROUP_KEY_STATE.hash_one(key.as_str());
+        Self { hash, key }
+    }
+
+    /// Partition this key belongs to
+    ///
+    /// Taken from bits 48..56 of the hash. hashbrown picks buckets from the
+    /// low bits and control tags from the top 7 bits, so keys that share a
+    /// partition still spread evenly within its table.
+    #[inline]
+    fn partition(&self) -> usize {
+        (self.hash >> 48) as usize & (NUM_PARTITIONS - 1)
+    }
+}
+
+impl Hash for GroupKey {
+    fn hash<H: Hasher>(&self, state: &mut H) {
+        state.write_u64(self.hash);
+    }
+}
+
+/// Hasher that passes a `GroupKey`'s precomputed hash through
+#[derive(Default)]
+struct GroupKeyHasher(u64);
+
+impl Hasher for GroupKeyHasher {
+    fn finish(&self) -> u64 {
+        self.0
+    }
+
+    fn write(&mut self, bytes: &[u8]) {
+        // Only reached for keys other than GroupKey; FNV-1a keeps it correct
+        for &byte in bytes {
+            self.0 = (self.0 ^ byte as u64).wrapping_mul(0x100_0000_01b3);
+        }
+    }
+
+    fn write_u64(&mut self, hash: u64) {
+        self.0 = hash;
+    }
+}
+
+/// Distinct argument expressions of a set of aggregates
+///
+/// Aggregates over the same column or constant, such as SUM(amount) and
+/// AVG(amount), share one slot: the argument is evaluated once per chunk and
+/// read once per row, however many aggregates consume it.
+struct AggregateArguments {
+    /// Deduplicated argument expressions
+    expressions: Vec<crate::expression::expression::ExpressionRef>,
+    /// Index into `expressions` for each aggregate (None for COUNT(*) with no argument)
+    slots: Vec<Option<usize>>,
+}
+
+/// Identity of an aggregate argument that can be shared between aggregates
+#[derive(PartialEq)]
+enum ArgumentKey {
+    Column(usize),
+    Constant(Value),
+}
+
+impl ArgumentKey {
+    /// Key for `expr`, or None if it must be evaluated for each aggregate
+    ///
+    /// Only column references and constants are shared. Other expressions
+    /// are not compared: their Debug output omits fields (CASE prints no
+    /// branches), and some are non-deterministic.
+    fn of(expr: &crate::expression::expression::ExpressionRef) -> Option<Self> {
+        use crate::expression::expression::{ColumnRefExpression, ConstantExpression};
+
+        let any = expr.as_any();
+        if let Some(column) = any.downcast_ref::<ColumnRefExpression>() {
+            return Some(ArgumentKey::Column(column.column_index()));
+        }
+        any.downcast_ref::<ConstantExpression>()
+            .map(|constant| ArgumentKey::Constant(constant.value().clone()))
+    }
+}
+
+impl AggregateArguments {
+    fn new(aggregates: &[crate::planner::PhysicalAggregateExpression]) -> Self {
+        let mut expressions: Vec<crate::expression::expression::ExpressionRef> = Vec::new();
+        let mut keys: Vec<Option<ArgumentKey>> = Vec::new();
+        let mut slots = Vec::with_capacity(aggregates.len());
+
+        for agg_expr in aggregates {
+            let arg = match agg_expr.arguments.first() {
+                Some(arg) => arg,
+                None => {
+                    slots.push(None);
+                    continue;
+                }
+            };
+
+            let key = ArgumentKey::of(arg);
+            let existing = key
+                .as_ref()
+                .and_then(|key| keys.iter().position(|k| k.as_ref() == Some(key)));
+            match existing {
+                Some(slot) => slots.push(Some(slot)),
+                None => {
+                    expressions.push(arg.clone());
+                    keys.push(key);
+                    slots.push(Some(expressions.len() - 1));
+                }
+            }
+        }
+
+        Self { expressions, slots }
+    }
+}
+
 /// Parallel Hash Aggregate Operator
 ///
 /// Architecture:
-/// 1. Thread-local Pre-aggregation:
-///    - Each thread maintains its own hash table
-///    - Process input chunks in parallel
+/// 1. Partitioned Pre-aggregation:
+///    - Each worker folds its input chunks into a private hash table split
+///      into NUM_PARTITIONS partitions by group key hash
+///    - GROUP BY and argument expressions are evaluated once per chunk, and
+///      aggregates sharing an argument read it once per row
+///    - Keys are hashed in a separate pass and rows are clustered by
+///      partition before probing, so each partition table is probed while
+///      it is hot in cache
 ///    - No synchronization during aggregation
 ///
-/// 2. Global Merge Phase:
-///    - Combine all thread-local hash tables
+/// 2. Partition-wise Merge Phase:
+///    - A group key always hashes to the same partition, so partitions are
+///      disjoint and each one is merged independently, in parallel
 ///    - Use AggregateState::merge() for combining states
-///    - Final hash table contains complete results
 ///
 /// Performance characteristics:
 /// - Pre-aggregation: O(n/p) per thread
-/// - Merge: O(k * t) where k=groups, t=threads
-/// - Memory: O(k * t) for thread-local tables
+/// - Merge: O(k * t / p) where k=groups, t=workers, p=threads
+/// - Memory: O(k * t) for worker-local tables
 pub struct ParallelHashAggregateOperator {
     aggregate: crate::planner::PhysicalAggregate,
     context: ExecutionContext,
@@ -341,23 +482,12 @@ impl ParallelHashAggregateOperator {
         Self { aggregate, context }
     }
 
-    /// Extract group key from a row
-    fn extract_group_key(
-        chunk: &DataChunk,
-        row_idx: usize,
-        group_by: &[crate::expression::expression::ExpressionRef],
-        context: &ExecutionContext,
-    ) -> PrismDBResult<String> {
-        if group_by.is_empty() {
-            return Ok(String::from("__global__"));
-        }
-
-        let mut key_parts = Vec::new();
-        for group_expr in group_by {
-            let result_vector = group_expr.evaluate(chunk, context)?;
-            let value = result_vector.get_value(row_idx)?;
+    /// Serialize the group key of a row from the evaluated GROUP BY vectors
+    fn group_key(group_vectors: &[Vector], row_idx: usize) -> PrismDBResult<String> {
+        let mut key_parts = Vec::with_capacity(group_vectors.len());
+        for vector in group_vectors {
             // Use custom serialization without quotes
-            key_parts.push(value_to_key_string(&value));
+            key_parts.push(value_to_key_string(&vector.get_value(row_idx)?));
         }
         Ok(key_parts.join("|"))
     }
@@ -420,79 +550,175 @@ impl ParallelHashAggregateOperator {
         }
     }
 
-    /// Process a single chunk and aggregate into thread-local hash table
+    /// Create fresh aggregate states for a new group
+    fn new_states(
+        aggregates: &[crate::planner::PhysicalAggregateExpression],
+    ) -> Vec<Box<dyn crate::expression::AggregateState>> {
+        aggregates
+            .iter()
+            .map(|agg_expr| {
+                crate::expression::create_aggregate_state(&agg_expr.function_name)
+                    .unwrap_or_else(|_| Box::new(crate::expression::CountState::new()))
+            })
+            .collect()
+    }
+
+    /// Aggregate a chunk into a worker's partitioned hash table
     fn aggregate_chunk(
+        partitions: &mut [GroupTable],
         chunk: &DataChunk,
         group_by: &[crate::expression::expression::ExpressionRef],
         aggregates: &[crate::planner::PhysicalAggregateExpression],
+        arguments: &AggregateArguments,
         context: &ExecutionContext,
-    ) -> PrismDBResult<std::collections::HashMap<String, Vec<Box<dyn crate::expression::AggregateState>>>> {
-        use std::collections::HashMap;
-
-        let mut local_ht: HashMap<String, Vec<Box<dyn crate::expression::AggregateState>>> =
-            HashMap::new();
-
-        for row_idx in 0..chunk.len() {
-            // Extract group key
-            let group_key = Self::extract_group_key(chunk, row_idx, group_by, context)?;
-
-            // Get or create aggregate states for this group
-            let states = local_ht.entry(group_key).or_insert_with(|| {
-                aggregates
-                    .iter()
-                    .map(|agg_expr| {
-                        crate::expression::create_aggregate_state(&agg_expr.function_name)
-                            .unwrap_or_else(|_| {
-                                Box::new(crate::expression::CountState::new())
-                            })
-                    })
-                    .collect()
-            });
-
-            // Update each aggregate state
-            for (agg_idx, agg_expr) in aggregates.iter().enumerate() {
-                // Evaluate the aggregate's argument expression
-                let arg_value = if agg_expr.arguments.is_empty() {
-                    // COUNT(*) - no arguments
-                    Value::integer(1)
-                } else {
-                    let result_vector = agg_expr.arguments[0].evaluate(chunk, context)?;
-                    result_vector.get_value(row_idx)?
-                };
+    ) -> PrismDBResult<()> {
+        // Evaluate GROUP BY and distinct argument expressions once per chunk
+        let group_vectors = group_by
+            .iter()
+            .map(|group_expr| group_expr.evaluate(chunk, context))
+            .collect::<PrismDBResult<Vec<_>>>()?;
+        let argument_vectors = arguments
+            .expressions
+            .iter()
+            .map(|arg| arg.evaluate(chunk, context))
+            .collect::<PrismDBResult<Vec<_>>>()?;
+
+        // COUNT(*) - no arguments
+        let count_star = Value::integer(1);
+        let num_rows = chunk.len();
+        let mut row_values = Vec::with_capacity(argument_vectors.len());
+
+        // Without GROUP BY every row updates the same states
+        if group_vectors.is_empty() {
+            let states = partitions[0]
+                .entry(GroupKey::new(String::from("__global__")))
+                .or_insert_with(|| Self::new_states(aggregates));
+            for row_idx in 0..num_rows {
+                Self::read_arguments(&argument_vectors, row_idx, &mut row_values)?;
+                Self::update_states(states, &arguments.slots, &row_values, &count_star)?;
+            }
+            return Ok(());
+        }
+
+        // Pass 1: serialize and hash every key before probing any table
+        let mut group_keys = Vec::with_capacity(num_rows);
+        let mut row_partitions = Vec::with_capacity(num_rows);
+        for row_idx in 0..num_rows {
+            let group_key = GroupKey::new(Self::group_key(&group_vectors, row_idx)?);
+            row_partitions.push(group_key.partition());
+            group_keys.push(group_key);
+        }
 
-                // Update the aggregate state
-                states[agg_idx].update(&arg_value)?;
+        // Pass 2: cluster row indices by partition (counting sort) so each
+        // partition table stays in cache while its rows are inserted
+        let mut offsets = vec![0usize; NUM_PARTITIONS + 1];
+        for &partition_idx in &row_partitions {
+            offsets[partition_idx + 1] += 1;
+        }
+        for partition_idx in 0..NUM_PARTITIONS {
+            offsets[partition_idx + 1] += offsets[partition_idx];
+        }
+        let mut next_slot = offsets.clone();
+        let mut clustered_rows = vec![0usize; num_rows];
+        for (row_idx, &partition_idx) in row_partitions.iter().enumerate() {
+            clustered_rows[next_slot[partition_idx]] = row_idx;
+            next_slot[partition_idx] += 1;
+        }
+
+        // Pass 3: probe and update one partition at a time
+        for (partition_idx, table) in partitions.iter_mut().enumerate() {
+            for &row_idx in &clustered_rows[offsets[partition_idx]..offsets[partition_idx + 1]] {
+                let group_key = std::mem::take(&mut group_keys[row_idx]);
+                let states = table
+                    .entry(group_key)
+                    .or_insert_with(|| Self::new_states(aggregates));
+                Self::read_arguments(&argument_vectors, row_idx, &mut row_values)?;
+                Self::update_states(states, &arguments.slots, &row_values, &count_star)?;
             }
         }
 
-        Ok(local_ht)
+        Ok(())
+    }
+
+    /// Read the value of every distinct argument at `row_idx` into `row_values`
+    #[inline]
+    fn read_arguments(
+        argument_vectors: &[Vector],
+        row_idx: usize,
+        row_values: &mut Vec<Value>,
+    ) -> PrismDBResult<()> {
+        row_values.clear();
+        for vector in argument_vectors {
+            row_values.push(vector.get_value(row_idx)?);
+        }
+        Ok(())
+    }
+
+    /// Update a group's states with one input row
+    #[inline]
+    fn update_states(
+        states: &mut [Box<dyn crate::expression::AggregateState>],
+        argument_slots: &[Option<usize>],
+        row_values: &[Value],
+        count_star: &Value,
+    ) -> PrismDBResult<()> {
+        for (state, slot) in states.iter_mut().zip(argument_slots) {
+            match slot {
+                Some(arg_idx) => state.update(&row_values[*arg_idx])?,
+                None => state.update(count_star)?,
+            }
+        }
+        Ok(())
     }
 
-    /// Merge two hash tables
-    fn merge_hash_tables(
-        mut global_ht: std::collections::HashMap<String, Vec<Box<dyn crate::expression::AggregateState>>>,
-        local_ht: std::collections::HashMap<String, Vec<Box<dyn crate::expression::AggregateState>>>,
-    ) -> PrismDBResult<std::collections::HashMap<String, Vec<Box<dyn crate::expression::AggregateState>>>> {
-        for (key, local_states) in local_ht {
-            if let Some(global_states) = global_ht.get_mut(&key) {
-                // Merge states for existing group
-                for (idx, local_state) in local_states.into_iter().enumerate() {
-                    global_states[idx].merge(local_state)?;
+    /// Merge the groups of one partition from every worker
+    fn merge_partition(mut tables: Vec<GroupTable>) -> PrismDBResult<GroupTable> {
+        // Merge into the largest table so the fewest groups are moved. It
+        // already holds at least as many groups as any other worker's table,
+        // so it only grows as far as the keys the workers do not share.
+        tables.sort_by_key(|table| std::cmp::Reverse(table.len()));
+        let mut tables = tables.into_iter();
+        let mut merged = tables.next().unwrap_or_default();
+
+        for table in tables {
+            for (key, states) in table {
+                if let Some(merged_states) = merged.get_mut(&key) {
+                    // Merge states for existing group
+                    for (idx, state) in states.into_iter().enumerate() {
+                        merged_states[idx].merge(state)?;
+                    }
+                } else {
+                    // New group - insert directly
+                    merged.insert(key, states);
                 }
-            } else {
-                // New group - insert directly
-                global_ht.insert(key, local_states);
             }
         }
-        Ok(global_ht)
+        Ok(merged)
+    }
+
+    /// Result of an aggregate with no groups: one row of initial values
+    /// without GROUP BY, no rows with it
+    fn empty_result(&self) -> PrismDBResult<Box<dyn DataChunkStream>> {
+        use crate::execution::SimpleDataChunkStream;
+
+        if !self.aggregate.group_by.is_empty() {
+            return Ok(Box::new(SimpleDataChunkStream::empty()));
+        }
+
+        let mut result_chunk = DataChunk::with_rows(1);
+        for (col_idx, agg_expr) in self.aggregate.aggregates.iter().enumerate() {
+            let state = crate::expression::create_aggregate_state(&agg_expr.function_name)?;
+            let result_value = state.finalize()?;
+            let vector = Vector::from_values(&[result_value])?;
+            result_chunk.set_vector(col_idx, vector)?;
+        }
+        Ok(Box::new(SimpleDataChunkStream::new(vec![result_chunk])))
     }
 }
 
 impl ExecutionOperator for ParallelHashAggregateOperator {
     fn execute(&self) -> PrismDBResult<Box<dyn DataChunkStream>> {
         use crate::execution::{ExecutionEngine, SimpleDataChunkStream};
-        use std::collections::HashMap;
-        use std::sync::Arc;
 
         // Execute the input plan and collect all chunks
         let mut engine = ExecutionEngine::new(self.context.clone());
@@ -508,103 +734,90 @@ impl ExecutionOperator for ParallelHashAggregateOperator {
         }
 
         if input_chunks.is_empty() {
-            // Handle empty input
-            if self.aggregate.group_by.is_empty() {
-                // No GROUP BY - return single row with initial aggregate values
-                let mut result_chunk = DataChunk::with_rows(1);
-                for (col_idx, agg_expr) in self.aggregate.aggregates.iter().enumerate() {
-                    let state =
-                        crate::expression::create_aggregate_state(&agg_expr.function_name)?;
-                    let result_value = state.finalize()?;
-                    let vector = Vector::from_values(&[result_value])?;
-                    result_chunk.set_vector(col_idx, vector)?;
-                }
-                return Ok(Box::new(SimpleDataChunkStream::new(vec![result_chunk])));
-            } else {
-                return Ok(Box::new(SimpleDataChunkStream::empty()));
-            }
+            return self.empty_result();
         }
 
-        // Phase 1: Thread-local pre-aggregation (parallel)
-        let group_by = Arc::new(self.aggregate.group_by.clone());
-        let aggregates = Arc::new(self.aggregate.aggregates.clone());
-        let context = self.context.clone();
+        let parallel = self.context.parallel_context.parallel_enabled && input_chunks.len() > 1;
+        let group_by = &self.aggregate.group_by[..];
+        let aggregates = &self.aggregate.aggregates[..];
+        let arguments = AggregateArguments::new(aggregates);
+        let arguments = &arguments;
+        let context = &self.context;
 
-        let local_hts: Vec<HashMap<String, Vec<Box<dyn crate::expression::AggregateState>>>> =
+        // Phase 1: Partitioned pre-aggregation into worker-local tables
+        let new_partitions = || -> Vec<GroupTable> {
+            (0..NUM_PARTITIONS).map(|_| GroupTable::default()).collect()
+        };
+        let fold_chunk = |mut partitions: Vec<GroupTable>, chunk: &DataChunk| -> PrismDBResult<Vec<GroupTable>> {
+            Self::aggregate_chunk(&mut partitions, chunk, group_by, aggregates, arguments, context)?;
+            Ok(partitions)
+        };
+        let worker_tables: Vec<Vec<GroupTable>> = if parallel {
             input_chunks
                 .par_iter()
-                .map(|chunk| {
-                    let gb = group_by.clone();
-                    let aggs = aggregates.clone();
-                    Self::aggregate_chunk(chunk, &gb[..], &aggs[..], &context)
-                        .unwrap_or_else(|_| HashMap::new())
-                })
-                .collect();
-
-        // Phase 2: Global merge (sequential, but fast)
-        let mut global_ht: HashMap<String, Vec<Box<dyn crate::expression::AggregateState>>> =
-            HashMap::new();
-
-        for local_ht in local_hts {
-            global_ht = Self::merge_hash_tables(global_ht, local_ht)?;
-        }
-
-        if global_ht.is_empty() {
-            // No groups after aggregation
-            if self.aggregate.group_by.is_empty() {
-                // No GROUP BY - return single row with initial values
-                let mut result_chunk = DataChunk::with_rows(1);
-                for (col_idx, agg_expr) in self.aggregate.aggregates.iter().enumerate() {
-                    let state =
-                        crate::expression::create_aggregate_state(&agg_expr.function_name)?;
-                    let result_value = state.finalize()?;
-                    let vector = Vector::from_values(&[result_value])?;
-                    result_chunk.set_vector(col_idx, vector)?;
+                .try_fold(new_partitions, fold_chunk)
+                .collect::<PrismDBResult<_>>()?
+        } else {
+            vec![input_chunks.iter().try_fold(new_partitions(), fold_chunk)?]
+        };
+
+        // Phase 2: Merge each partition across workers
+        let mut by_partition: Vec<Vec<GroupTable>> = (0..NUM_PARTITIONS)
+            .map(|_| Vec::with_capacity(worker_tables.len()))
+            .collect();
+        for partitions in worker_tables {
+            for (partition_idx, table) in partitions.into_iter().enumerate() {
+                if !table.is_empty() {
+                    by_partition[partition_idx].push(table);
                 }
-                return Ok(Box::new(SimpleDataChunkStream::new(vec![result_chunk])));
-            } else {
-                return Ok(Box::new(SimpleDataChunkStream::empty()));
             }
         }
+        let merged: Vec<GroupTable> = if parallel {
+            by_partition
+                .into_par_iter()
+                .map(Self::merge_partition)
+                .collect::<PrismDBResult<_>>()?
+        } else {
+            by_partition
+                .into_iter()
+                .map(Self::merge_partition)
+                .collect::<PrismDBResult<_>>()?
+        };
 
-        // Phase 3: Convert hash table to result chunk
-        let num_groups = global_ht.len();
-        let _num_columns = self.aggregate.group_by.len() + self.aggregate.aggregates.len();
-        let mut result_chunk = DataChunk::with_rows(num_groups);
-
-        // Build columns for GROUP BY expressions
-        for (group_col_idx, _group_expr) in self.aggregate.group_by.iter().enumerate() {
-            let mut group_values = Vec::new();
+        let num_groups: usize = merged.iter().map(|table| table.len()).sum();
+        if num_groups == 0 {
+            return self.empty_result();
+        }
 
-            // Get the correct type from schema
-            let expected_type = &self.aggregate.schema[group_col_idx].data_type;
+        // Phase 3: Convert the partitions to a result chunk
+        let group_count = self.aggregate.group_by.len();
+        let mut columns: Vec<Vec<Value>> = (0..group_count + self.aggregate.aggregates.len())
+            .map(|_| Vec::with_capacity(num_groups))
+            .collect();
 
-            for group_key in global_ht.keys() {
-                let key_parts: Vec<&str> = group_key.split('|').collect();
-                if group_col_idx < key_parts.len() {
-                    // Parse value back to correct type based on schema
-                    let value = Self::parse_value_from_string(key_parts[group_col_idx], expected_type)?;
-                    group_values.push(value);
-                } else {
-                    group_values.push(Value::Null);
+        for (group_key, states) in merged.iter().flat_map(|table| table.iter()) {
+            // Build GROUP BY columns, parsing each key part back to its schema type
+            if group_count > 0 {
+                let key_parts: Vec<&str> = group_key.key.split('|').collect();
+                for group_col_idx in 0..group_count {
+                    let expected_type = &self.aggregate.schema[group_col_idx].data_type;
+                    let value = match key_parts.get(group_col_idx) {
+                        Some(part) => Self::parse_value_from_string(part, expected_type)?,
+                        None => Value::Null,
+                    };
+                    columns[group_col_idx].push(value);
                 }
             }
-            let vector = Vector::from_values(&group_values)?;
-            result_chunk.set_vector(group_col_idx, vector)?;
-        }
-
-        // Build columns for aggregate results
-        for (agg_idx, _agg_expr) in self.aggregate.aggregates.iter().enumerate() {
-            let col_idx = self.aggregate.group_by.len() + agg_idx;
-            let mut agg_values = Vec::new();
 
-            for states in global_ht.values() {
-                let result_value = states[agg_idx].finalize()?;
-                agg_values.push(result_value);
+            // Build aggregate result columns
+            for (agg_idx, state) in states.iter().enumerate() {
+                columns[group_count + agg_idx].push(state.finalize()?);
             }
+        }
 
-            let vector = Vector::from_values(&agg_values)?;
-            result_chunk.set_vector(col_idx, vector)?;
+        let mut result_chunk = DataChunk::with_rows(num_groups);
+        for (col_idx, values) in columns.iter().enumerate() {
+            result_chunk.set_vector(col_idx, Vector::from_values(values)?)?;
         }
 
         Ok(Box::new(SimpleDataChunkStream::new(vec![result_chunk])))
@@ -363,6 +363,62 @@ impl FunctionExpression {
     pub fn is_aggregate(&self) -> bool {
         self.is_aggregate
     }
+
+    /// Evaluate AND (`is_and`) or OR by combining both operand masks
+    ///
+    /// Both operands are evaluated over the whole chunk and merged with a
+    /// single bitwise pass, with no per-row branching. Short-circuiting only
+    /// happens per chunk: the right operand is skipped when the left mask
+    /// already decides every row. Returns `None` when an operand has NULLs
+    /// or is not boolean, leaving those rows to the generic path; the
+    /// operands evaluated so far are then left in `operands` so the generic
+    /// path does not evaluate them again.
+    fn evaluate_conjunction(
+        &self,
+        is_and: bool,
+        chunk: &DataChunk,
+        context: &crate::execution::ExecutionContext,
+        operands: &mut Vec<Vector>,
+    ) -> PrismDBResult<Option<Vector>> {
+        let count = chunk.count();
+        operands.push(self.children[0].evaluate(chunk, context)?);
+        match boolean_mask(&operands[0], count) {
+            // AND with an all-false or OR with an all-true left side is decided
+            Some(left_mask) if left_mask.iter().all(|&b| (b != 0) != is_and) => {
+                return Ok(Some(Vector::from_booleans(&vec![!is_and; count])));
+            }
+            Some(_) => {}
+            None => return Ok(None),
+        }
+
+        operands.push(self.children[1].evaluate(chunk, context)?);
+        let (left_mask, right_mask) = match (
+            boolean_mask(&operands[0], count),
+            boolean_mask(&operands[1], count),
+        ) {
+            (Some(left_mask), Some(right_mask)) => (left_mask, right_mask),
+            _ => return Ok(None),
+        };
+
+        let combined: Vec<bool> = if is_and {
+            left_mask.iter().zip(right_mask).map(|(&l, &r)| (l & r) != 0).collect()
+        } else {
+            left_mask.iter().zip(right_mask).map(|(&l, &r)| (l | r) != 0).collect()
+        };
+        Ok(Some(Vector::from_booleans(&combined)))
+    }
+}
+
+/// Raw 0/1 bytes of a null-free, unselected BOOLEAN vector of `count` rows
+fn boolean_mask(vector: &Vector, count: usize) -> Option<&[u8]> {
+    if *vector.get_type() != LogicalType::Boolean
+        || vector.count() != count
+        || vector.null_count() > 0
+        || vector.get_selection().is_some()
+    {
+        return None;
+    }
+    vector.fixed_width_data()
 }
 
 impl Expression for FunctionExpression {
@@ -377,9 +433,20 @@ impl Expression for FunctionExpression {
     fn evaluate(&self, chunk: &DataChunk, context: &crate::execution::ExecutionContext) -> PrismDBResult<Vector> {
         use crate::expression::function::evaluate_builtin_function;
 
-        // Evaluate all child expressions
-        let mut arg_vectors = Vec::new();
-        for child in &self.children {
+        let mut arg_vectors = Vec::with_capacity(self.children.len());
+
+        // Fast path: AND/OR over null-free boolean masks
+        if self.children.len() == 2 {
+            let is_and = self.function_name.eq_ignore_ascii_case("AND");
+            if is_and || self.function_name.eq_ignore_ascii_case("OR") {
+                if let Some(result) = self.evaluate_conjunction(is_and, chunk, context, &mut arg_vectors)? {
+                    return Ok(result);
+                }
+            }
+        }
+
+        // Evaluate the child expressions the fast path did not already evaluate
+        for child in &self.children[arg_vectors.len()..] {
             let child_result = child.evaluate(chunk, context)?;
             arg_vectors.push(child_result);
         }
@@ -568,8 +635,19 @@ impl Expression for ComparisonExpression {
     }
 
     fn evaluate(&self, chunk: &DataChunk, context: &crate::execution::ExecutionContext) -> PrismDBResult<Vector> {
+        // Fast path: `expr <op> constant` over a numeric column
         let left_result = self.left.evaluate(chunk, context)?;
+        if let Some(constant) = self.right.as_any().downcast_ref::<ConstantExpression>() {
+            if let Some(result) = self.compare_with_constant(&left_result, constant.value(), false, chunk.count()) {
+                return Ok(result);
+            }
+        }
         let right_result = self.right.evaluate(chunk, context)?;
+        if let Some(constant) = self.left.as_any().downcast_ref::<ConstantExpression>() {
+            if let Some(result) = self.compare_with_constant(&right_result, constant.value(), true, chunk.count()) {
+                return Ok(result);
+            }
+        }
 
         // Perform comparison row by row
         let mut results = Vec::with_capacity(chunk.count());
@@ -602,7 +680,121 @@ impl Expression for ComparisonExpression {
     }
 }
 
+/// Numeric constant operand of a column-vs-constant comparison
+#[derive(Clone, Copy)]
+enum NumericConstant {
+    Integer(i64),
+    Double(f64),
+}
+
+/// Apply `comparison` between every element and `constant`
+///
+/// The comparison is matched once, outside the loop, so each arm is a
+/// straight-line loop the compiler can vectorize.
+fn compare_all<T: PartialOrd + Copy>(
+    values: impl Iterator<Item = T>,
+    constant: T,
+    comparison: &ComparisonType,
+) -> Vec<bool> {
+    match comparison {
+        ComparisonType::Equal => values.map(|v| v == constant).collect(),
+        ComparisonType::NotEqual => values.map(|v| v != constant).collect(),
+        ComparisonType::LessThan => values.map(|v| v < constant).collect(),
+        ComparisonType::LessThanOrEqual => values.map(|v| v <= constant).collect(),
+        ComparisonType::GreaterThan => values.map(|v| v > constant).collect(),
+        ComparisonType::GreaterThanOrEqual => values.map(|v| v >= constant).collect(),
+        _ => unreachable!("only ordering comparisons reach compare_all"),
+    }
+}
+
 impl ComparisonExpression {
+    /// Compare a numeric vector against a constant directly on its storage
+    ///
+    /// Handles null-free TINYINT/SMALLINT/INTEGER/BIGINT/DOUBLE vectors
+    /// compared with an integer or DOUBLE constant, using the same numeric
+    /// promotion as `Value::compare`. When `flipped` is set the constant is
+    /// the left operand. Returns `None` for anything else, leaving it to the
+    /// row-by-row path.
+    fn compare_with_constant(
+        &self,
+        vector: &Vector,
+        constant: &Value,
+        flipped: bool,
+        count: usize,
+    ) -> Option<Vector> {
+        let comparison = match (&self.comparison_type, flipped) {
+            (ComparisonType::Equal, _) => ComparisonType::Equal,
+            (ComparisonType::NotEqual, _) => ComparisonType::NotEqual,
+            (ComparisonType::LessThan, false) | (ComparisonType::GreaterThan, true) => ComparisonType::LessThan,
+            (ComparisonType::LessThanOrEqual, false) | (ComparisonType::GreaterThanOrEqual, true) => {
+                ComparisonType::LessThanOrEqual
+            }
+            (ComparisonType::GreaterThan, false) | (ComparisonType::LessThan, true) => ComparisonType::GreaterThan,
+            (ComparisonType::GreaterThanOrEqual, false) | (ComparisonType::LessThanOrEqual, true) => {
+                ComparisonType::GreaterThanOrEqual
+            }
+            _ => return None,
+        };
+
+        let constant = match constant {
+            Value::TinyInt(v) => NumericConstant::Integer(*v as i64),
+            Value::SmallInt(v) => NumericConstant::Integer(*v as i64),
+            Value::Integer(v) => NumericConstant::Integer(*v as i64),
+            Value::BigInt(v) => NumericConstant::Integer(*v),
+            Value::Double(v) if !v.is_nan() => NumericConstant::Double(*v),
+            _ => return None,
+        };
+
+        // NULL ordering and NaN errors are left to the row-by-row path
+        if vector.count() != count || vector.null_count() > 0 {
+            return None;
+        }
+        let data = vector.fixed_width_data()?;
+
+        let integers: Vec<i64> = match vector.get_type() {
+            LogicalType::TinyInt => data.iter().map(|&b| b as i8 as i64).collect(),
+            LogicalType::SmallInt => data
+                .chunks_exact(2)
+                .map(|b| i16::from_le_bytes([b[0], b[1]]) as i64)
+                .collect(),
+            LogicalType::Integer => data
+                .chunks_exact(4)
+                .map(|b| i32::from_le_bytes([b[0], b[1], b[2], b[3]]) as i64)
+                .collect(),
+            LogicalType::BigInt => data
+                .chunks_exact(8)
+                .map(|b| i64::from_le_bytes([b[0], b[1], b[2], b[3], b[4], b[5], b[6], b[7]]))
+                .collect(),
+            LogicalType::Double => {
+                let doubles: Vec<f64> = data
+                    .chunks_exact(8)
+                    .map(|b| f64::from_le_bytes([b[0], b[1], b[2], b[3], b[4], b[5], b[6], b[7]]))
+                    .collect();
+                if doubles.iter().any(|v| v.is_nan()) {
+                    return None;
+                }
+                let constant = match constant {
+                    NumericConstant::Integer(c) => c as f64,
+                    NumericConstant::Double(c) => c,
+                };
+                return Some(Vector::from_booleans(&compare_all(
+                    doubles.into_iter(),
+                    constant,
+                    &comparison,
+                )));
+            }
+            _ => return None,
+        };
+
+        let results = match constant {
+            NumericConstant::Integer(c) => compare_all(integers.into_iter(), c, &comparison),
+            NumericConstant::Double(c) => {
+                compare_all(integers.into_iter().map(|v| v as f64), c, &comparison)
+            }
+        };
+        Some(Vector::from_booleans(&results))
+    }
+
     fn compare_values(&self, left: &Value, right: &Value) -> PrismDBResult<Value> {
         let result = match self.comparison_type {
             ComparisonType::Equal => left.compare(right)? == std::cmp::Ordering::Equal,
@@ -1598,6 +1790,190 @@ mod tests {
         Ok(())
     }
 
+    #[test]
+    fn test_comparison_with_constant_matches_row_path() -> PrismDBResult<()> {
+        use crate::catalog::Catalog;
+        use crate::execution::ExecutionContext;
+        use crate::storage::TransactionManager;
+        use std::sync::RwLock;
+
+        let context = ExecutionContext::new(
+            Arc::new(TransactionManager::new()),
+            Arc::new(RwLock::new(Catalog::new())),
+        );
+        let mut chunk = DataChunk::new();
+        chunk.add_vector(Vector::from_values(&[
+            Value::integer(10),
+            Value::integer(25),
+            Value::integer(40),
+        ])?)?;
+
+        let column = Arc::new(ColumnRefExpression::new(0, "age".to_string(), LogicalType::Integer))
+            as ExpressionRef;
+        let constant = Arc::new(ConstantExpression::new(Value::integer(25))?) as ExpressionRef;
+
+        // age > 25 on the fast path
+        let expr = ComparisonExpression::new(ComparisonType::GreaterThan, column.clone(), constant.clone());
+        let result = expr.evaluate(&chunk, &context)?;
+        for row in 0..chunk.count() {
+            assert_eq!(result.get_value(row)?, expr.evaluate_row(&chunk, row, &context)?);
+        }
+        assert_eq!(result.get_value(2)?, Value::Boolean(true));
+
+        // 25 <= age, with the constant on the left
+        let expr = ComparisonExpression::new(ComparisonType::LessThanOrEqual, constant, column);
+        let result = expr.evaluate(&chunk, &context)?;
+        for row in 0..chunk.count() {
+            assert_eq!(result.get_value(row)?, expr.evaluate_row(&chunk, row, &context)?);
+        }
+        assert_eq!(result.get_value(0)?, Value::Boolean(false));
+        Ok(())
+    }
+
+    #[test]
+    fn test_conjunction_of_masks() -> PrismDBResult<()> {
+        use crate::catalog::Catalog;
+        use crate::execution::ExecutionContext;
+        use crate::storage::TransactionManager;
+        use std::sync::RwLock;
+
+        let context = ExecutionContext::new(
+            Arc::new(TransactionManager::new()),
+            Arc::new(RwLock::new(Catalog::new())),
+        );
+        let mut chunk = DataChunk::new();
+        chunk.add_vector(Vector::from_values(&[
+            Value::integer(10),
+            Value::integer(25),
+            Value::integer(40),
+            Value::integer(30),
+        ])?)?;
+
+        let column = Arc::new(ColumnRefExpression::new(0, "age".to_string(), LogicalType::Integer))
+            as ExpressionRef;
+        let compare = |comparison_type: ComparisonType, value: i32| -> PrismDBResult<ExpressionRef> {
+            let constant = Arc::new(ConstantExpression::new(Value::integer(value))?) as ExpressionRef;
+            Ok(Arc::new(ComparisonExpression::new(comparison_type, column.clone(), constant)) as ExpressionRef)
+        };
+        let conjunction = |name: &str, left: ExpressionRef, right: ExpressionRef| {
+            FunctionExpression::new(name.to_string(), LogicalType::Boolean, vec![left, right])
+        };
+        let booleans = |vector: &Vector| -> PrismDBResult<Vec<Value>> {
+            (0..vector.count()).map(|row| vector.get_value(row)).collect()
+        };
+
+        // age > 20 AND age < 35
+        let expr = conjunction(
+            "AND",
+            compare(ComparisonType::GreaterThan, 20)?,
+            compare(ComparisonType::LessThan, 35)?,
+        );
+        assert_eq!(
+            booleans(&expr.evaluate(&chunk, &context)?)?,
+            [false, true, false, true].map(Value::Boolean)
+        );
+
+        // age < 15 OR age > 35
+        let expr = conjunction(
+            "OR",
+            compare(ComparisonType::LessThan, 15)?,
+            compare(ComparisonType::GreaterThan, 35)?,
+        );
+        assert_eq!(
+            booleans(&expr.evaluate(&chunk, &context)?)?,
+            [true, false, true, false].map(Value::Boolean)
+        );
+
+        // An all-false left side decides AND for the whole chunk
+        let expr = conjunction(
+            "AND",
+            compare(ComparisonType::GreaterThan, 100)?,
+            compare(ComparisonType::GreaterThan, 20)?,
+        );
+        assert_eq!(booleans(&expr.evaluate(&chunk, &context)?)?, vec![Value::Boolean(false); 4]);
+        Ok(())
+    }
+
+    /// Counts how often the wrapped expression is evaluated
+    #[derive(Debug)]
+    struct CountingExpression {
+        inner: ExpressionRef,
+        evaluations: std::sync::atomic::AtomicUsize,
+    }
+
+    impl Expression for CountingExpression {
+        fn return_type(&self) -> &LogicalType {
+            self.inner.return_type()
+        }
+
+        fn evaluate(&self, chunk: &DataChunk, context: &crate::execution::ExecutionContext) -> PrismDBResult<Vector> {
+            self.evaluations.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+            self.inner.evaluate(chunk, context)
+        }
+
+        fn evaluate_row(&self, chunk: &DataChunk, row_idx: usize, context: &crate::execution::ExecutionContext) -> PrismDBResult<Value> {
+            self.inner.evaluate_row(chunk, row_idx, context)
+        }
+
+        fn is_deterministic(&self) -> bool {
+            self.inner.is_deterministic()
+        }
+
+        fn is_nullable(&self) -> bool {
+            self.inner.is_nullable()
+        }
+
+        fn as_any(&self) -> &dyn std::any::Any {
+            self
+        }
+    }
+
+    #[test]
+    fn test_nullable_conjunction_evaluates_operands_once() -> PrismDBResult<()> {
+        use crate::catalog::Catalog;
+        use crate::execution::ExecutionContext;
+        use crate::storage::TransactionManager;
+        use std::sync::atomic::{AtomicUsize, Ordering};
+        use std::sync::RwLock;
+
+        let context = ExecutionContext::new(
+            Arc::new(TransactionManager::new()),
+            Arc::new(RwLock::new(Catalog::new())),
+        );
+        let mut chunk = DataChunk::new();
+        chunk.add_vector(Vector::from_values(&[
+            Value::Boolean(true),
+            Value::Null,
+            Value::Boolean(false),
+        ])?)?;
+        chunk.add_vector(Vector::from_values(&[
+            Value::Boolean(true),
+            Value::Boolean(true),
+            Value::Boolean(false),
+        ])?)?;
+
+        let counting = |index: usize| {
+            Arc::new(CountingExpression {
+                inner: Arc::new(ColumnRefExpression::new(index, format!("c{}", index), LogicalType::Boolean)),
+                evaluations: AtomicUsize::new(0),
+            })
+        };
+        let left = counting(0);
+        let right = counting(1);
+
+        // The left mask has a NULL, so the generic path combines the operands
+        let expr = FunctionExpression::new(
+            "AND".to_string(),
+            LogicalType::Boolean,
+            vec![left.clone() as ExpressionRef, right.clone() as ExpressionRef],
+        );
+        let result = expr.evaluate(&chunk, &context)?;
+        assert_eq!(result.count(), 3);
+        assert_eq!(left.evaluations.load(Ordering::Relaxed), 1);
+        assert_eq!(right.evaluations.load(Ordering::Relaxed), 1);
+        Ok(())
+    }
+
     #[test]
     fn test_cast_expression() -> PrismDBResult<()> {
         let child = Arc::new(ConstantExpression::new(Value::integer(42))?) as ExpressionRef;
@@ -580,7 +580,7 @@ fn execute_sql(database: &Database, sql: &str, settings: &Settings) -> Result<()
 
             // Only display the table for non-DML results
             if !is_dml_result && result.row_count() > 0 {
-                println!("{}", result.to_table_string());
+                println!("{}", result.to_table_string()?);
                 println!();
             }
 
@@ -651,7 +651,13 @@ fn main() -> Result<(), Box<dyn std::error::Error>> {
                 println!("Query executed successfully");
                 println!("Rows: {}", result.row_count());
                 if result.row_count() > 0 {
-                    println!("{}", result.to_table_string());
+                    match result.to_table_string() {
+                        Ok(table) => println!("{}", table),
+                        Err(e) => {
+                            eprintln!("Error executing query: {}", e);
+                            process::exit(1);
+                        }
+                    }
                 }
             }
             Err(e) => {
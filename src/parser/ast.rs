@@ -3,10 +3,11 @@
 //! Defines the structure of parsed SQL statements.
 
 use crate::types::LogicalType;
+use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 
 /// SQL statement types
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum Statement {
     Select(SelectStatement),
     Insert(InsertStatement),
@@ -32,7 +33,7 @@ pub enum Statement {
 }
 
 /// SELECT statement
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct SelectStatement {
     pub with_clause: Option<WithClause>,  // Common Table Expressions (CTEs)
     pub distinct: bool,
@@ -49,14 +50,14 @@ pub struct SelectStatement {
 }
 
 /// WITH clause (Common Table Expressions)
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct WithClause {
     pub recursive: bool,
     pub ctes: Vec<CommonTableExpression>,
 }
 
 /// Common Table Expression (CTE)
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct CommonTableExpression {
     pub name: String,
     pub columns: Vec<String>,  // Optional column names
@@ -64,7 +65,7 @@ pub struct CommonTableExpression {
 }
 
 /// Set operation (UNION, INTERSECT, EXCEPT)
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct SetOperation {
     pub op_type: SetOperationType,
     pub all: bool,  // For UNION ALL vs UNION
@@ -72,7 +73,7 @@ pub struct SetOperation {
 }
 
 /// Type of set operation
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum SetOperationType {
     Union,
     Intersect,
@@ -80,7 +81,7 @@ pub enum SetOperationType {
 }
 
 /// SELECT list item
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum SelectItem {
     Expression(Expression),
     QualifiedWildcard(String), // table.*
@@ -89,7 +90,7 @@ pub enum SelectItem {
 }
 
 /// Table reference
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum TableReference {
     Table {
         name: String,
@@ -123,7 +124,7 @@ pub enum TableReference {
 }
 
 /// Join type
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum JoinType {
     Inner,
     Left,
@@ -133,14 +134,14 @@ pub enum JoinType {
 }
 
 /// Join condition
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum JoinCondition {
     On(Expression),
     Using(Vec<String>),
 }
 
 /// ORDER BY expression
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct OrderByExpression {
     pub expression: Expression,
     pub ascending: bool,
@@ -148,14 +149,14 @@ pub struct OrderByExpression {
 }
 
 /// LIMIT clause
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct LimitClause {
     pub limit: usize,
     pub offset: Option<usize>,
 }
 
 /// INSERT statement
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct InsertStatement {
     pub table_name: String,
     pub columns: Vec<String>,
@@ -164,7 +165,7 @@ pub struct InsertStatement {
 }
 
 /// INSERT source
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum InsertSource {
     Values(Vec<Vec<Expression>>),
     Select(SelectStatement),
@@ -172,7 +173,7 @@ pub enum InsertSource {
 }
 
 /// ON CONFLICT clause
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum OnConflict {
     DoNothing,
     DoUpdate {
@@ -182,7 +183,7 @@ pub enum OnConflict {
 }
 
 /// UPDATE statement
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct UpdateStatement {
     pub table_name: String,
     pub assignments: Vec<Assignment>,
@@ -190,21 +191,21 @@ pub struct UpdateStatement {
 }
 
 /// DELETE statement
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct DeleteStatement {
     pub table_name: String,
     pub where_clause: Option<Expression>,
 }
 
 /// Assignment (SET column = value)
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct Assignment {
     pub column: String,
     pub value: Expression,
 }
 
 /// CREATE TABLE statement
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct CreateTableStatement {
     pub table_name: String,
     pub columns: Vec<ColumnDefinition>,
@@ -213,7 +214,7 @@ pub struct CreateTableStatement {
 }
 
 /// Column definition
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct ColumnDefinition {
     pub name: String,
     pub data_type: LogicalType,
@@ -223,7 +224,7 @@ pub struct ColumnDefinition {
 }
 
 /// Column constraint
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum ColumnConstraint {
     PrimaryKey,
     Unique,
@@ -235,7 +236,7 @@ pub enum ColumnConstraint {
 }
 
 /// Table constraint
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum TableConstraint {
     PrimaryKey {
         columns: Vec<String>,
@@ -257,21 +258,21 @@ pub enum TableConstraint {
 }
 
 /// DROP TABLE statement
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct DropTableStatement {
     pub table_name: String,
     pub if_exists: bool,
 }
 
 /// ALTER TABLE statement
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct AlterTableStatement {
     pub table_name: String,
     pub operation: AlterTableOperation,
 }
 
 /// ALTER TABLE operation
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum AlterTableOperation {
     AddColumn(ColumnDefinition),
     DropColumn { column_name: String },
@@ -282,7 +283,7 @@ pub enum AlterTableOperation {
 }
 
 /// CREATE VIEW statement
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct CreateViewStatement {
     pub view_name: String,
     pub columns: Vec<String>,
@@ -294,7 +295,7 @@ pub struct CreateViewStatement {
 }
 
 /// Refresh strategy for materialized views
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum ViewRefreshStrategy {
     Manual,
     OnCommit,
@@ -303,7 +304,7 @@ pub enum ViewRefreshStrategy {
 }
 
 /// DROP VIEW statement
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct DropViewStatement {
     pub view_name: String,
     pub if_exists: bool,
@@ -311,14 +312,14 @@ pub struct DropViewStatement {
 }
 
 /// REFRESH MATERIALIZED VIEW statement
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct RefreshMaterializedViewStatement {
     pub view_name: String,
     pub concurrently: bool,
 }
 
 /// CREATE INDEX statement
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct CreateIndexStatement {
     pub index_name: String,
     pub table_name: String,
@@ -328,20 +329,20 @@ pub struct CreateIndexStatement {
 }
 
 /// DROP INDEX statement
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct DropIndexStatement {
     pub index_name: String,
     pub if_exists: bool,
 }
 
 /// BEGIN statement
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct BeginStatement {
     pub transaction_mode: Option<TransactionMode>,
 }
 
 /// Transaction mode
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum TransactionMode {
     ReadWrite,
     ReadOnly,
@@ -351,20 +352,20 @@ pub enum TransactionMode {
 }
 
 /// COMMIT statement
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct CommitStatement {
     pub chain: bool,
 }
 
 /// ROLLBACK statement
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct RollbackStatement {
     pub savepoint: Option<String>,
     pub chain: bool,
 }
 
 /// EXPLAIN statement
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct ExplainStatement {
     pub statement: Box<Statement>,
     pub analyze: bool,
@@ -372,7 +373,7 @@ pub struct ExplainStatement {
 }
 
 /// SHOW statement
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum ShowStatement {
     Tables,
     Columns { table: String },
@@ -383,26 +384,26 @@ pub enum ShowStatement {
 }
 
 /// INSTALL statement (for installing extensions)
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct InstallStatement {
     pub extension_name: String,
 }
 
 /// LOAD statement (for loading extensions)
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct LoadStatement {
     pub extension_name: String,
 }
 
 /// SET statement (for configuration variables)
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct SetStatement {
     pub variable: String,
     pub value: SetValue,
 }
 
 /// Value types for SET statement
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum SetValue {
     String(String),
     Number(i64),
@@ -411,7 +412,7 @@ pub enum SetValue {
 }
 
 /// CREATE SECRET statement
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct CreateSecretStatement {
     pub or_replace: bool,
     pub name: String,
@@ -420,7 +421,7 @@ pub struct CreateSecretStatement {
 }
 
 /// Expression AST
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum Expression {
     // Literals
     Literal(LiteralValue),
@@ -509,7 +510,7 @@ pub enum Expression {
 }
 
 /// Literal values
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum LiteralValue {
     Null,
     Boolean(bool),
@@ -523,7 +524,7 @@ pub enum LiteralValue {
 }
 
 /// Binary operators
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum BinaryOperator {
     // Arithmetic
     Add,
@@ -559,7 +560,7 @@ pub enum BinaryOperator {
 }
 
 /// Unary operators
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum UnaryOperator {
     Plus,
     Minus,
@@ -569,7 +570,7 @@ pub enum UnaryOperator {
 }
 
 /// Window specification
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct WindowSpec {
     pub partition_by: Vec<Expression>,
     pub order_by: Vec<OrderByExpression>,
@@ -577,7 +578,7 @@ pub struct WindowSpec {
 }
 
 /// Window frame
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct WindowFrame {
     pub units: WindowFrameUnits,
     pub start_bound: WindowFrameBound,
@@ -585,7 +586,7 @@ pub struct WindowFrame {
 }
 
 /// Window frame units
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum WindowFrameUnits {
     Rows,
     Range,
@@ -593,7 +594,7 @@ pub enum WindowFrameUnits {
 }
 
 /// Window frame bound
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum WindowFrameBound {
     CurrentRow,
     UnboundedPreceding,
@@ -605,7 +606,7 @@ pub enum WindowFrameBound {
 /// PIVOT specification
 /// Supports both simplified syntax (PIVOT dataset ON columns USING values)
 /// and SQL Standard syntax (FROM dataset PIVOT (values FOR columns IN (in_list)))
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct PivotSpec {
     /// Columns to pivot (create new columns for each distinct value)
     pub on_columns: Vec<Expression>,
@@ -620,14 +621,14 @@ pub struct PivotSpec {
 }
 
 /// PIVOT value specification (aggregate expression with optional alias)
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct PivotValue {
     pub expression: Expression,
     pub alias: Option<String>,
 }
 
 /// PIVOT IN value (explicit column value specification)
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct PivotInValue {
     /// The value from the ON column that should get its own column
     /// Example: In "FOR year IN (2000, 2010, 2020)", these are 2000, 2010, 2020
@@ -640,7 +641,7 @@ pub struct PivotInValue {
 /// UNPIVOT specification
 /// Supports both simplified syntax (UNPIVOT dataset ON columns INTO NAME/VALUE)
 /// and SQL Standard syntax (FROM dataset UNPIVOT [INCLUDE NULLS] (value FOR name IN (columns)))
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct UnpivotSpec {
     /// Columns to unpivot (stack into rows)
     pub on_columns: Vec<Expression>,
@@ -673,7 +674,281 @@ impl QueryParameters {
     }
 }
 
+impl Statement {
+    /// Number of positional `?` parameters referenced by the statement
+    pub fn parameter_count(&self) -> usize {
+        let mut count = 0;
+        let mut statement = self.clone();
+        let _ = statement.visit_expressions_mut(&mut |expr| {
+            if let Expression::Parameter(index) = expr {
+                count = count.max(*index + 1);
+            }
+            Ok(())
+        });
+        count
+    }
+
+    /// Return a copy of the statement with every `?` placeholder replaced by
+    /// its literal value from `params`
+    pub fn bind_parameters(
+        &self,
+        params: &QueryParameters,
+    ) -> crate::common::error::PrismDBResult<Statement> {
+        let mut statement = self.clone();
+        statement.visit_expressions_mut(&mut |expr| expr.bind_parameter(params))?;
+        Ok(statement)
+    }
+
+    /// Apply `f` to every expression node reachable from the statement
+    fn visit_expressions_mut(
+        &mut self,
+        f: &mut dyn FnMut(&mut Expression) -> crate::common::error::PrismDBResult<()>,
+    ) -> crate::common::error::PrismDBResult<()> {
+        match self {
+            Statement::Select(select) => select.visit_expressions_mut(f),
+            Statement::Insert(insert) => {
+                match &mut insert.source {
+                    InsertSource::Values(rows) => {
+                        for expr in rows.iter_mut().flatten() {
+                            expr.visit_mut(f)?;
+                        }
+                    }
+                    InsertSource::Select(select) => select.visit_expressions_mut(f)?,
+                    InsertSource::DefaultValues => {}
+                }
+                Ok(())
+            }
+            Statement::Update(update) => {
+                for assignment in &mut update.assignments {
+                    assignment.value.visit_mut(f)?;
+                }
+                if let Some(expr) = &mut update.where_clause {
+                    expr.visit_mut(f)?;
+                }
+                Ok(())
+            }
+            Statement::Delete(delete) => {
+                if let Some(expr) = &mut delete.where_clause {
+                    expr.visit_mut(f)?;
+                }
+                Ok(())
+            }
+            Statement::Explain(explain) => explain.statement.visit_expressions_mut(f),
+            _ => Ok(()),
+        }
+    }
+}
+
+impl SelectStatement {
+    fn visit_expressions_mut(
+        &mut self,
+        f: &mut dyn FnMut(&mut Expression) -> crate::common::error::PrismDBResult<()>,
+    ) -> crate::common::error::PrismDBResult<()> {
+        if let Some(with_clause) = &mut self.with_clause {
+            for cte in &mut with_clause.ctes {
+                cte.query.visit_expressions_mut(f)?;
+            }
+        }
+        for item in &mut self.select_list {
+            match item {
+                SelectItem::Expression(expr) => expr.visit_mut(f)?,
+                SelectItem::Alias(expr, _) => expr.visit_mut(f)?,
+                SelectItem::QualifiedWildcard(_) | SelectItem::Wildcard => {}
+            }
+        }
+        if let Some(from) = &mut self.from {
+            from.visit_expressions_mut(f)?;
+        }
+        if let Some(expr) = &mut self.where_clause {
+            expr.visit_mut(f)?;
+        }
+        for expr in &mut self.group_by {
+            expr.visit_mut(f)?;
+        }
+        if let Some(expr) = &mut self.having {
+            expr.visit_mut(f)?;
+        }
+        if let Some(expr) = &mut self.qualify {
+            expr.visit_mut(f)?;
+        }
+        for order in &mut self.order_by {
+            order.expression.visit_mut(f)?;
+        }
+        for set_op in &mut self.set_operations {
+            set_op.query.visit_expressions_mut(f)?;
+        }
+        Ok(())
+    }
+}
+
+impl TableReference {
+    fn visit_expressions_mut(
+        &mut self,
+        f: &mut dyn FnMut(&mut Expression) -> crate::common::error::PrismDBResult<()>,
+    ) -> crate::common::error::PrismDBResult<()> {
+        match self {
+            TableReference::Table { .. } => Ok(()),
+            TableReference::Join {
+                left,
+                right,
+                condition,
+                ..
+            } => {
+                left.visit_expressions_mut(f)?;
+                right.visit_expressions_mut(f)?;
+                if let JoinCondition::On(expr) = condition {
+                    expr.visit_mut(f)?;
+                }
+                Ok(())
+            }
+            TableReference::Subquery { subquery, .. } => subquery.visit_expressions_mut(f),
+            TableReference::TableFunction { arguments, .. } => {
+                for expr in arguments {
+                    expr.visit_mut(f)?;
+                }
+                Ok(())
+            }
+            TableReference::Pivot { source, .. } | TableReference::Unpivot { source, .. } => {
+                source.visit_expressions_mut(f)
+            }
+        }
+    }
+}
+
 impl Expression {
+    /// Replace this node with its bound literal if it is a parameter placeholder
+    fn bind_parameter(
+        &mut self,
+        params: &QueryParameters,
+    ) -> crate::common::error::PrismDBResult<()> {
+        if let Expression::Parameter(index) = self {
+            let value = params.get_parameter(*index).ok_or_else(|| {
+                crate::common::error::PrismDBError::InvalidArgument(format!(
+                    "No value supplied for parameter {}",
+                    index
+                ))
+            })?;
+            *self = Expression::Literal(value.clone());
+        }
+        Ok(())
+    }
+
+    /// Apply `f` to this expression and, depth-first, to all of its children
+    pub(crate) fn visit_mut(
+        &mut self,
+        f: &mut dyn FnMut(&mut Expression) -> crate::common::error::PrismDBResult<()>,
+    ) -> crate::common::error::PrismDBResult<()> {
+        f(self)?;
+        match self {
+            Expression::FunctionCall { arguments, .. }
+            | Expression::AggregateFunction { arguments, .. } => {
+                for expr in arguments {
+                    expr.visit_mut(f)?;
+                }
+            }
+            Expression::WindowFunction {
+                arguments,
+                window_spec,
+                ..
+            } => {
+                for expr in arguments {
+                    expr.visit_mut(f)?;
+                }
+                for expr in &mut window_spec.partition_by {
+                    expr.visit_mut(f)?;
+                }
+                for order in &mut window_spec.order_by {
+                    order.expression.visit_mut(f)?;
+                }
+            }
+            Expression::Case {
+                operand,
+                conditions,
+                results,
+                else_result,
+            } => {
+                if let Some(expr) = operand {
+                    expr.visit_mut(f)?;
+                }
+                for expr in conditions.iter_mut().chain(results.iter_mut()) {
+                    expr.visit_mut(f)?;
+                }
+                if let Some(expr) = else_result {
+                    expr.visit_mut(f)?;
+                }
+            }
+            Expression::Between {
+                expression,
+                low,
+                high,
+                ..
+            }
+            | Expression::BetweenSymmetric {
+                expression,
+                low,
+                high,
+                ..
+            } => {
+                expression.visit_mut(f)?;
+                low.visit_mut(f)?;
+                high.visit_mut(f)?;
+            }
+            Expression::InList {
+                expression, list, ..
+            } => {
+                expression.visit_mut(f)?;
+                for expr in list {
+                    expr.visit_mut(f)?;
+                }
+            }
+            Expression::InSubquery {
+                expression,
+                subquery,
+                ..
+            } => {
+                expression.visit_mut(f)?;
+                subquery.visit_expressions_mut(f)?;
+            }
+            Expression::Exists(subquery) | Expression::Subquery(subquery) => {
+                subquery.visit_expressions_mut(f)?;
+            }
+            Expression::Like {
+                expression,
+                pattern,
+                escape,
+                ..
+            } => {
+                expression.visit_mut(f)?;
+                pattern.visit_mut(f)?;
+                if let Some(expr) = escape {
+                    expr.visit_mut(f)?;
+                }
+            }
+            Expression::Binary { left, right, .. } => {
+                left.visit_mut(f)?;
+                right.visit_mut(f)?;
+            }
+            Expression::Cast { expression, .. }
+            | Expression::Unary { expression, .. }
+            | Expression::IsNull(expression)
+            | Expression::IsNotNull(expression)
+            | Expression::IsTrue(expression)
+            | Expression::IsFalse(expression)
+            | Expression::IsUnknown(expression)
+            | Expression::IsNotTrue(expression)
+            | Expression::IsNotFalse(expression)
+            | Expression::IsNotUnknown(expression) => {
+                expression.visit_mut(f)?;
+            }
+            Expression::Literal(_)
+            | Expression::ColumnReference { .. }
+            | Expression::Parameter(_)
+            | Expression::QualifiedWildcard { .. }
+            | Expression::Wildcard => {}
+        }
+        Ok(())
+    }
+
     /// Evaluate the expression on a data chunk
     /// This is a stub implementation - full expression evaluation should be
     /// delegated to the expression module
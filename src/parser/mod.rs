@@ -6,11 +6,13 @@
 pub mod ast;
 pub mod keywords;
 pub mod parser;
+pub mod statement_cache;
 pub mod tokenizer;
 
 pub use ast::*;
 pub use keywords::*;
 pub use parser::*;
+pub use statement_cache::StatementCache;
 pub use tokenizer::*;
 
 use crate::common::error::PrismDBResult;
@@ -13,6 +13,8 @@ use std::collections::HashMap;
 pub struct Parser {
     tokens: Vec<Token>,
     position: usize,
+    /// Number of positional `?` parameters seen so far
+    parameter_count: usize,
 }
 
 impl Parser {
@@ -21,6 +23,7 @@ impl Parser {
         Self {
             tokens,
             position: 0,
+            parameter_count: 0,
         }
     }
 
@@ -816,6 +819,13 @@ impl Parser {
                 let _ = self.consume_keyword(Keyword::Null);
                 Ok(Expression::Literal(LiteralValue::Null))
             }
+            // Positional parameter placeholder, numbered from 0 in order of appearance
+            TokenType::QuestionMark => {
+                self.position += 1;
+                let index = self.parameter_count;
+                self.parameter_count += 1;
+                Ok(Expression::Parameter(index))
+            }
             // Handle CASE expression
             TokenType::Keyword(Keyword::Case) => {
                 self.parse_case_expression()
@@ -1673,7 +1683,7 @@ impl Parser {
                 let table = self.parse_drop_table_statement()?;
                 Ok(Statement::DropTable(table))
             }
-            TokenType::Keyword(Keyword::View) => {
+            TokenType::Keyword(Keyword::View) | TokenType::Keyword(Keyword::Materialized) => {
                 let view = self.parse_drop_view_statement()?;
                 Ok(Statement::DropView(view))
             }
@@ -1689,10 +1699,10 @@ impl Parser {
 
     /// Parse DROP TABLE statement
     fn parse_drop_table_statement(&mut self) -> PrismDBResult<DropTableStatement> {
+        self.consume_keyword(Keyword::Table)?;
+
         let if_exists = self.consume_keyword(Keyword::If).is_ok()
             && self.consume_keyword(Keyword::Exists).is_ok();
-
-        self.consume_keyword(Keyword::Table)?;
         let table_name = self.consume_identifier()?;
 
         Ok(DropTableStatement {
@@ -1706,10 +1716,10 @@ impl Parser {
         // Check for MATERIALIZED keyword
         let materialized = self.consume_keyword(Keyword::Materialized).is_ok();
 
+        self.consume_keyword(Keyword::View)?;
+
         let if_exists = self.consume_keyword(Keyword::If).is_ok()
             && self.consume_keyword(Keyword::Exists).is_ok();
-
-        self.consume_keyword(Keyword::View)?;
         let view_name = self.consume_identifier()?;
 
         Ok(DropViewStatement {
@@ -1721,10 +1731,10 @@ impl Parser {
 
     /// Parse DROP INDEX statement
     fn parse_drop_index_statement(&mut self) -> PrismDBResult<DropIndexStatement> {
+        self.consume_keyword(Keyword::Index)?;
+
         let if_exists = self.consume_keyword(Keyword::If).is_ok()
             && self.consume_keyword(Keyword::Exists).is_ok();
-
-        self.consume_keyword(Keyword::Index)?;
         let index_name = self.consume_identifier()?;
 
         Ok(DropIndexStatement {
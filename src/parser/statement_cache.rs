@@ -0,0 +1,315 @@
+//! Cache of parsed SQL statements
+//!
+//! Parsing depends only on the SQL text, so the statements produced for a
+//! given string can be reused for every later execution of it, regardless of
+//! catalog changes. Planning still happens on every execution.
+//!
+//! Entries are kept in memory and, when a cache directory is configured, also
+//! written to `<dir>/<hash>.bin` so later processes start warm.
+//!
+//! Only statements likely to be executed again are cached: queries, DML and
+//! transaction control. DDL, `INSERT ... VALUES` with literal rows and very
+//! long SQL texts are parsed on every execution instead, so one-off bulk
+//! loads do not fill the cache with large ASTs.
+
+use crate::common::error::{PrismDBError, PrismDBResult};
+use crate::parser::ast::{InsertSource, Statement};
+use serde::{Deserialize, Serialize};
+use std::collections::HashMap;
+use std::fs;
+use std::path::{Path, PathBuf};
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::sync::{Arc, RwLock};
+use std::time::SystemTime;
+
+/// Maximum number of in-memory entries before the cache is reset
+const MAX_CACHED_STATEMENTS: usize = 1024;
+
+/// Longest SQL text that is cached
+const MAX_CACHED_SQL_LEN: usize = 4096;
+
+/// Maximum number of entries kept in the cache directory
+const MAX_PERSISTED_STATEMENTS: usize = 4096;
+
+/// On-disk representation of a cache entry
+#[derive(Serialize, Deserialize)]
+struct CachedStatements {
+    /// PrismDB version that wrote the entry; entries from other versions are ignored
+    version: String,
+    /// Normalized SQL text, checked on load to rule out hash collisions
+    sql: String,
+    statements: Vec<Statement>,
+}
+
+/// Cache of parsed statements keyed by normalized SQL text
+#[derive(Debug, Default)]
+pub struct StatementCache {
+    entries: RwLock<HashMap<String, Arc<Vec<Statement>>>>,
+    directory: Option<PathBuf>,
+    /// Number of entries currently in the cache directory
+    persisted: AtomicUsize,
+    /// Entry count at which the oldest half of the directory is deleted
+    max_persisted: usize,
+}
+
+impl StatementCache {
+    /// Create a cache that only lives in memory
+    pub fn in_memory() -> Self {
+        Self::default()
+    }
+
+    /// Create a cache that also persists entries under `directory`
+    pub fn persistent(directory: impl Into<PathBuf>) -> PrismDBResult<Self> {
+        let directory = directory.into();
+        fs::create_dir_all(&directory)?;
+        let persisted = persisted_entries(&directory).len();
+        Ok(Self {
+            entries: RwLock::new(HashMap::new()),
+            directory: Some(directory),
+            persisted: AtomicUsize::new(persisted),
+            max_persisted: MAX_PERSISTED_STATEMENTS,
+        })
+    }
+
+    /// Directory entries are persisted to, if any
+    pub fn directory(&self) -> Option<&PathBuf> {
+        self.directory.as_ref()
+    }
+
+    /// Number of statements cached in memory
+    pub fn len(&self) -> usize {
+        self.entries.read().map(|entries| entries.len()).unwrap_or(0)
+    }
+
+    /// Check if the in-memory cache is empty
+    pub fn is_empty(&self) -> bool {
+        self.len() == 0
+    }
+
+    /// Return the cached statements for `sql`, calling `parse` on a miss
+    ///
+    /// Parse errors are returned as-is and never cached, and neither are
+    /// statements rejected by `is_cacheable`.
+    pub fn get_or_parse<F>(&self, sql: &str, parse: F) -> PrismDBResult<Arc<Vec<Statement>>>
+    where
+        F: FnOnce(&str) -> PrismDBResult<Vec<Statement>>,
+    {
+        let key = sql.trim();
+        if key.len() > MAX_CACHED_SQL_LEN {
+            return Ok(Arc::new(parse(sql)?));
+        }
+
+        if let Some(statements) = self.read_entries()?.get(key) {
+            return Ok(statements.clone());
+        }
+
+        let statements = match self.load(key) {
+            Some(statements) => Arc::new(statements),
+            None => {
+                let statements = Arc::new(parse(sql)?);
+                if !is_cacheable(key, &statements) {
+                    return Ok(statements);
+                }
+                self.store(key, &statements);
+                statements
+            }
+        };
+
+        let mut entries = self
+            .entries
+            .write()
+            .map_err(|_| PrismDBError::Internal("Statement cache lock poisoned".to_string()))?;
+        if entries.len() >= MAX_CACHED_STATEMENTS {
+            entries.clear();
+        }
+        entries.insert(key.to_string(), statements.clone());
+        Ok(statements)
+    }
+
+    /// Drop all in-memory entries; persisted entries are kept
+    pub fn clear(&self) {
+        if let Ok(mut entries) = self.entries.write() {
+            entries.clear();
+        }
+    }
+
+    fn read_entries(
+        &self,
+    ) -> PrismDBResult<std::sync::RwLockReadGuard<'_, HashMap<String, Arc<Vec<Statement>>>>> {
+        self.entries
+            .read()
+            .map_err(|_| PrismDBError::Internal("Statement cache lock poisoned".to_string()))
+    }
+
+    /// Path of the persisted entry for `key`
+    fn entry_path(&self, key: &str) -> Option<PathBuf> {
+        let hash = twox_hash::XxHash64::oneshot(0, key.as_bytes());
+        self.directory
+            .as_ref()
+            .map(|directory| directory.join(format!("{:016x}.bin", hash)))
+    }
+
+    /// Load a persisted entry, ignoring missing, stale or corrupt files
+    fn load(&self, key: &str) -> Option<Vec<Statement>> {
+        let bytes = fs::read(self.entry_path(key)?).ok()?;
+        let (cached, _): (CachedStatements, usize) =
+            bincode::serde::decode_from_slice(&bytes, bincode::config::standard()).ok()?;
+        if cached.version != env!("CARGO_PKG_VERSION") || cached.sql != key {
+            return None;
+        }
+        Some(cached.statements)
+    }
+
+    /// Persist an entry; the cache is best-effort, so write failures are ignored
+    fn store(&self, key: &str, statements: &[Statement]) {
+        let path = match self.entry_path(key) {
+            Some(path) => path,
+            None => return,
+        };
+        let cached = CachedStatements {
+            version: env!("CARGO_PKG_VERSION").to_string(),
+            sql: key.to_string(),
+            statements: statements.to_vec(),
+        };
+        if let Ok(bytes) = bincode::serde::encode_to_vec(&cached, bincode::config::standard()) {
+            // Write to a temporary file first so readers never see a partial entry
+            let tmp_path = path.with_extension(format!("tmp{}", std::process::id()));
+            if fs::write(&tmp_path, bytes).is_err() {
+                return;
+            }
+            if fs::rename(&tmp_path, &path).is_err() {
+                let _ = fs::remove_file(&tmp_path);
+                return;
+            }
+        }
+
+        if self.persisted.fetch_add(1, Ordering::Relaxed) + 1 >= self.max_persisted {
+            if let Some(directory) = self.directory.as_ref() {
+                self.prune(directory);
+            }
+        }
+    }
+
+    /// Delete the least recently written half of the persisted entries
+    fn prune(&self, directory: &Path) {
+        let mut entries = persisted_entries(directory);
+        entries.sort();
+        let excess = entries.len().saturating_sub(self.max_persisted / 2);
+        let mut removed = 0;
+        for (_, path) in &entries[..excess] {
+            if fs::remove_file(path).is_ok() {
+                removed += 1;
+            }
+        }
+        self.persisted.store(entries.len() - removed, Ordering::Relaxed);
+    }
+}
+
+/// Whether `statements` parsed from `sql` are worth keeping in the cache
+///
+/// DDL and literal `INSERT ... VALUES` rows are rarely executed twice with
+/// the same text; an insert whose SQL contains `?` placeholders is
+/// kept, since it is typically re-executed with new parameters.
+fn is_cacheable(sql: &str, statements: &[Statement]) -> bool {
+    statements.iter().all(|statement| match statement {
+        Statement::Insert(insert) => {
+            !matches!(insert.source, InsertSource::Values(_)) || sql.contains('?')
+        }
+        Statement::Select(_)
+        | Statement::Update(_)
+        | Statement::Delete(_)
+        | Statement::Explain(_)
+        | Statement::Begin(_)
+        | Statement::Commit(_)
+        | Statement::Rollback(_) => true,
+        _ => false,
+    })
+}
+
+/// Persisted entries in `directory` with their modification times
+fn persisted_entries(directory: &Path) -> Vec<(SystemTime, PathBuf)> {
+    let entries = match fs::read_dir(directory) {
+        Ok(entries) => entries,
+        Err(_) => return Vec::new(),
+    };
+    entries
+        .filter_map(|entry| entry.ok())
+        .map(|entry| entry.path())
+        .filter(|path| path.extension().map_or(false, |ext| ext == "bin"))
+        .map(|path| {
+            let modified = fs::metadata(&path)
+                .and_then(|metadata| metadata.modified())
+                .unwrap_or(SystemTime::UNIX_EPOCH);
+            (modified, path)
+        })
+        .collect()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::parser::{Parser, Tokenizer};
+
+    fn parse(sql: &str) -> PrismDBResult<Vec<Statement>> {
+        let tokens = Tokenizer::new().tokenize(sql)?;
+        Parser::new(tokens).parse_statements()
+    }
+
+    #[test]
+    fn test_cache_hit_skips_parsing() -> PrismDBResult<()> {
+        let cache = StatementCache::in_memory();
+        let first = cache.get_or_parse("SELECT 1", parse)?;
+        let second = cache.get_or_parse("  SELECT 1 ", |_| panic!("statement should be cached"))?;
+        assert!(Arc::ptr_eq(&first, &second));
+        assert_eq!(cache.len(), 1);
+        Ok(())
+    }
+
+    #[test]
+    fn test_parse_errors_are_not_cached() {
+        let cache = StatementCache::in_memory();
+        assert!(cache.get_or_parse("SELEC 1", parse).is_err());
+        assert!(cache.is_empty());
+    }
+
+    #[test]
+    fn test_persistent_cache_survives_restart() -> PrismDBResult<()> {
+        let directory = tempfile::tempdir()?;
+        let sql = "SELECT id, name FROM users WHERE id > 1";
+
+        let expected = StatementCache::persistent(directory.path())?.get_or_parse(sql, parse)?;
+
+        // A fresh cache over the same directory loads the entry from disk
+        let cache = StatementCache::persistent(directory.path())?;
+        let loaded = cache.get_or_parse(sql, |_| panic!("statement should be loaded from disk"))?;
+        assert_eq!(loaded, expected);
+        Ok(())
+    }
+
+    #[test]
+    fn test_one_off_statements_are_not_cached() -> PrismDBResult<()> {
+        let cache = StatementCache::in_memory();
+        cache.get_or_parse("CREATE TABLE users (id INTEGER)", parse)?;
+        cache.get_or_parse("INSERT INTO users VALUES (1), (2)", parse)?;
+        assert!(cache.is_empty());
+
+        cache.get_or_parse("INSERT INTO users VALUES (?)", parse)?;
+        cache.get_or_parse("SELECT * FROM users", parse)?;
+        assert_eq!(cache.len(), 2);
+        Ok(())
+    }
+
+    #[test]
+    fn test_persisted_entries_are_pruned() -> PrismDBResult<()> {
+        let directory = tempfile::tempdir()?;
+        let mut cache = StatementCache::persistent(directory.path())?;
+        cache.max_persisted = 4;
+
+        for id in 0..10 {
+            cache.get_or_parse(&format!("SELECT * FROM users WHERE id = {}", id), parse)?;
+        }
+        let persisted = persisted_entries(directory.path()).len();
+        assert!(persisted < 4, "expected fewer than 4 entries on disk, found {}", persisted);
+        Ok(())
+    }
+}
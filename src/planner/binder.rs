@@ -1512,7 +1512,7 @@ impl Binder {
     }
 
     /// Check if a function name is an aggregate function
-    fn is_aggregate_function(name: &str) -> bool {
+    pub fn is_aggregate_function(name: &str) -> bool {
         matches!(
             name.to_uppercase().as_str(),
             "COUNT" | "SUM" | "AVG" | "MIN" | "MAX" | "STDDEV" | "VARIANCE" | "STRING_AGG"
@@ -159,6 +159,25 @@ mod tests {
         Ok(())
     }
 
+    #[test]
+    fn test_drop_table_if_exists_planning() -> PrismDBResult<()> {
+        let sql = "DROP TABLE IF EXISTS users";
+        let statement = parse_sql(sql)?;
+
+        let mut planner = QueryPlanner::new();
+        let logical_plan = planner.plan_statement(&statement)?;
+
+        match logical_plan {
+            LogicalPlan::DropTable(drop) => {
+                assert_eq!(drop.table_name, "users");
+                assert!(drop.if_exists);
+            }
+            _ => panic!("Expected DropTable as plan node"),
+        }
+
+        Ok(())
+    }
+
     #[test]
     fn test_explain_planning() -> PrismDBResult<()> {
         let sql = "EXPLAIN SELECT id FROM users";
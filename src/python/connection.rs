@@ -1,10 +1,16 @@
 //! Python connection class for PrismDB
 
 use pyo3::prelude::*;
-use pyo3::exceptions::PyRuntimeError;
-use crate::Database;
+use pyo3::exceptions::{PyRuntimeError, PyValueError};
+use pyo3::types::{PyByteArray, PyDict};
+use crate::{Database, DatabaseConfig};
 use super::cursor::PyCursor;
-use super::result::PyQueryResult;
+use super::result::{columns_to_dict, value_to_pyobject, PyQueryResult};
+use super::statement::PyPreparedStatement;
+use super::params::{
+    buffer_to_values, execute_batch, execute_sql, is_numeric_type, parse_single_statement,
+    pyobject_to_value, run_without_gil,
+};
 
 /// PrismDB database connection
 ///
@@ -20,7 +26,12 @@ impl PyPrismDB {
     /// Create a new database connection
     ///
     /// Args:
-    ///     path (str, optional): Path to database file. If None, creates an in-memory database.
+    ///     path (str, optional): Path to database file. If None or ":memory:", creates an
+    ///         in-memory database.
+    ///     threads (int, optional): Number of worker threads for parallel query execution.
+    ///         Defaults to the number of CPUs.
+    ///     plan_cache_dir (str, optional): Directory parsed statements are cached in, so
+    ///         later connections skip parsing SQL they have seen before.
     ///
     /// Returns:
     ///     Connection: A new database connection
@@ -28,14 +39,32 @@ impl PyPrismDB {
     /// Examples:
     ///     >>> db = prismdb.Connection()  # In-memory
     ///     >>> db = prismdb.Connection('mydata.db')  # File-based
+    ///     >>> db = prismdb.Connection(threads=4)
     #[new]
-    #[pyo3(signature = (path=None))]
-    pub fn new(path: Option<String>) -> PyResult<Self> {
-        let db = if let Some(p) = path {
-            Database::open(p).map_err(|e| PyRuntimeError::new_err(format!("Failed to open database: {}", e)))?
-        } else {
-            Database::new_in_memory().map_err(|e| PyRuntimeError::new_err(format!("Failed to create in-memory database: {}", e)))?
+    #[pyo3(signature = (path=None, threads=None, plan_cache_dir=None))]
+    pub fn new(
+        path: Option<String>,
+        threads: Option<usize>,
+        plan_cache_dir: Option<String>,
+    ) -> PyResult<Self> {
+        // ":memory:" selects an in-memory database, as in sqlite3
+        let path = path.filter(|p| p != ":memory:");
+        let mut config = match path {
+            Some(ref p) => DatabaseConfig::from_file(p.clone()),
+            None => DatabaseConfig::in_memory(),
         };
+        if let Some(threads) = threads {
+            if threads == 0 {
+                return Err(PyValueError::new_err("threads must be at least 1"));
+            }
+            config.threads = threads;
+        }
+        config.plan_cache_dir = plan_cache_dir;
+
+        let db = Database::new(config).map_err(|e| match path {
+            Some(_) => PyRuntimeError::new_err(format!("Failed to open database: {}", e)),
+            None => PyRuntimeError::new_err(format!("Failed to create in-memory database: {}", e)),
+        })?;
         Ok(PyPrismDB { db })
     }
 
@@ -43,6 +72,7 @@ impl PyPrismDB {
     ///
     /// Args:
     ///     sql (str): SQL query to execute
+    ///     parameters (sequence, optional): Values for the `?` placeholders in `sql`
     ///
     /// Returns:
     ///     QueryResult: Query results
@@ -51,12 +81,71 @@ impl PyPrismDB {
     ///     >>> result = db.execute("SELECT * FROM users")
     ///     >>> for row in result:
     ///     ...     print(row)
-    pub fn execute(&self, sql: &str) -> PyResult<PyQueryResult> {
-        let result = self.db.execute_sql_collect(sql)
-            .map_err(|e| PyRuntimeError::new_err(format!("Query execution failed: {}", e)))?;
+    ///     >>> result = db.execute("SELECT * FROM users WHERE id = ?", (1,))
+    #[pyo3(signature = (sql, parameters=None))]
+    pub fn execute(&self, sql: &str, parameters: Option<&PyAny>, py: Python) -> PyResult<PyQueryResult> {
+        let result = execute_sql(&self.db, sql, parameters, py)?;
         Ok(PyQueryResult::new(result))
     }
 
+    /// Execute a filtered query, returning its unfiltered columns and a row mask
+    ///
+    /// The WHERE predicate is evaluated into a mask instead of filtering the
+    /// rows, so the caller can apply it lazily or aggregate over it without
+    /// building filtered copies of the columns. Rows where the predicate is
+    /// NULL are masked out, as with a filter.
+    ///
+    /// Args:
+    ///     sql (str): A single SELECT without DISTINCT, GROUP BY, HAVING,
+    ///         ORDER BY, LIMIT, OFFSET or set operations
+    ///     numpy (bool): Return numpy arrays instead of lists
+    ///
+    /// Returns:
+    ///     tuple: ``(columns, mask)``, where ``columns`` maps each selected column
+    ///         name to its values for all scanned rows and ``mask`` holds one
+    ///         bool per row
+    ///
+    /// Examples:
+    ///     >>> columns, mask = db.execute_bitmap("SELECT name, age FROM users WHERE age > 25")
+    ///     >>> names, ages = columns.values()
+    ///     >>> [name for name, keep in zip(names, mask) if keep]
+    ///     ['Alice', 'Charlie']
+    #[pyo3(signature = (sql, numpy=false))]
+    pub fn execute_bitmap(&self, sql: &str, numpy: bool, py: Python) -> PyResult<(PyObject, PyObject)> {
+        let sql = sql.to_string();
+        let (result, mask) = run_without_gil(py, &self.db, move |db| db.execute_bitmap(&sql))?;
+
+        if numpy {
+            let numpy = py.import("numpy")?;
+            let columns = columns_to_dict(&result, 0..result.row_count(), Some(numpy), py)?;
+            let bytes: Vec<u8> = mask.iter().map(|&keep| keep as u8).collect();
+            let mask = numpy.call_method1("frombuffer", (PyByteArray::new(py, &bytes), "bool"))?;
+            Ok((columns, mask.to_object(py)))
+        } else {
+            let columns = columns_to_dict(&result, 0..result.row_count(), None, py)?;
+            Ok((columns, mask.to_object(py)))
+        }
+    }
+
+    /// Execute a SQL statement once for each parameter set
+    ///
+    /// The statement is parsed once. `INSERT ... VALUES` statements are
+    /// combined into a single multi-row insert, so the whole batch is planned
+    /// and executed in one pass.
+    ///
+    /// Args:
+    ///     sql (str): SQL statement with `?` placeholders
+    ///     seq_of_parameters (iterable): Sequence of parameter tuples
+    ///
+    /// Examples:
+    ///     >>> db.executemany("INSERT INTO users VALUES (?, ?)",
+    ///     ...                [(1, 'Alice'), (2, 'Bob')])
+    pub fn executemany(&self, sql: &str, seq_of_parameters: &PyAny) -> PyResult<()> {
+        let statement = parse_single_statement(&self.db, sql)?;
+        execute_batch(&self.db, &statement, seq_of_parameters)?;
+        Ok(())
+    }
+
     /// Execute a SQL statement (no results expected)
     ///
     /// Args:
@@ -70,12 +159,125 @@ impl PyPrismDB {
     ///     0
     ///     >>> db.execute_many("INSERT INTO users VALUES (1, 'Alice')")
     ///     1
-    pub fn execute_many(&self, sql: &str) -> PyResult<usize> {
-        let result = self.db.execute_sql_collect(sql)
-            .map_err(|e| PyRuntimeError::new_err(format!("Query execution failed: {}", e)))?;
+    pub fn execute_many(&self, sql: &str, py: Python) -> PyResult<usize> {
+        let result = execute_sql(&self.db, sql, None, py)?;
         Ok(result.row_count())
     }
 
+    /// Prepare a SQL statement for repeated execution
+    ///
+    /// Args:
+    ///     sql (str): A single SQL statement, optionally with `?` placeholders
+    ///
+    /// Returns:
+    ///     PreparedStatement: The parsed statement
+    ///
+    /// Examples:
+    ///     >>> ins = db.prepare("INSERT INTO users VALUES (?, ?)")
+    ///     >>> ins.executemany([(1, 'Alice'), (2, 'Bob')])
+    ///     >>> ins.execute((3, 'Charlie'))
+    pub fn prepare(&self, sql: &str) -> PyResult<PyPreparedStatement> {
+        let statement = parse_single_statement(&self.db, sql)?;
+        Ok(PyPreparedStatement::new(self.db.clone(), sql.to_string(), statement))
+    }
+
+    /// Bulk-load column-oriented data into an existing table
+    ///
+    /// The batch is appended to table storage directly, bypassing SQL
+    /// parsing and planning. Numeric columns given as numpy arrays (or any
+    /// other one-dimensional numeric buffer) are copied straight from the
+    /// buffer; other columns are converted element by element.
+    ///
+    /// Args:
+    ///     table_name (str): Name of the target table
+    ///     columns (dict): Mapping of column name to a list or array of values;
+    ///         every table column must be present and all columns must be the
+    ///         same length
+    ///
+    /// Returns:
+    ///     int: Number of inserted rows
+    ///
+    /// Examples:
+    ///     >>> db.insert_columns("users", {"id": [1, 2], "name": ["Alice", "Bob"]})
+    ///     2
+    pub fn insert_columns(&self, table_name: &str, columns: &PyDict, py: Python) -> PyResult<usize> {
+        let table_columns = self.db.get_table_columns(table_name)
+            .map_err(|e| PyRuntimeError::new_err(format!("Insert failed: {}", e)))?;
+
+        if columns.len() != table_columns.len() {
+            return Err(PyValueError::new_err(format!(
+                "Expected {} columns for table '{}', got {}",
+                table_columns.len(), table_name, columns.len()
+            )));
+        }
+
+        let mut batch = Vec::with_capacity(table_columns.len());
+        for column in &table_columns {
+            let values = columns.get_item(&column.name)?.ok_or_else(|| {
+                PyValueError::new_err(format!("Missing values for column '{}'", column.name))
+            })?;
+
+            if let Some(converted) = buffer_to_values(values, &column.column_type)? {
+                batch.push(converted);
+                continue;
+            }
+
+            let mut converted = Vec::with_capacity(values.len().unwrap_or(0));
+            for value in values.iter()? {
+                converted.push(pyobject_to_value(value?, &column.column_type)?);
+            }
+            batch.push(converted);
+        }
+
+        let db = self.db.clone();
+        let table_name = table_name.to_string();
+        py.allow_threads(move || db.append_columns(&table_name, batch))
+            .map_err(|e| PyRuntimeError::new_err(format!("Insert failed: {}", e)))
+    }
+
+    /// Bulk-load an Arrow table into an existing table
+    ///
+    /// Accepts a `pyarrow.Table` or `pyarrow.RecordBatch` and loads it
+    /// through `insert_columns`. Numeric columns without nulls are read via
+    /// `to_numpy()` and copied from the array buffer; other columns are
+    /// converted from `to_pylist()` element by element. The pinned pyo3
+    /// cannot use Arrow's C data interface, so this is not zero-copy.
+    ///
+    /// Args:
+    ///     table_name (str): Name of the target table
+    ///     arrow_table: Arrow table whose column names match the target table
+    ///
+    /// Returns:
+    ///     int: Number of inserted rows
+    ///
+    /// Examples:
+    ///     >>> import pyarrow as pa
+    ///     >>> db.insert_arrow("users", pa.table({"id": [1, 2], "name": ["Alice", "Bob"]}))
+    ///     2
+    pub fn insert_arrow(&self, table_name: &str, arrow_table: &PyAny) -> PyResult<usize> {
+        let py = arrow_table.py();
+        let table_columns = self.db.get_table_columns(table_name)
+            .map_err(|e| PyRuntimeError::new_err(format!("Insert failed: {}", e)))?;
+
+        let columns = PyDict::new(py);
+        for name in arrow_table.getattr("column_names")?.iter()? {
+            let name: &str = name?.extract()?;
+            let column = arrow_table.call_method1("column", (name,))?;
+            let numeric = table_columns
+                .iter()
+                .any(|c| c.name == name && is_numeric_type(&c.column_type));
+            let values = if numeric && column.getattr("null_count")?.extract::<usize>()? == 0 {
+                let kwargs = PyDict::new(py);
+                kwargs.set_item("zero_copy_only", false)?;
+                column.call_method("to_numpy", (), Some(kwargs))?
+            } else {
+                column.call_method0("to_pylist")?
+            };
+            columns.set_item(name, values)?;
+        }
+        self.insert_columns(table_name, columns, py)
+    }
+
     /// Create a cursor for executing queries
     ///
     /// Returns:
@@ -101,14 +303,45 @@ impl PyPrismDB {
     ///     >>> rows = db.sql("SELECT * FROM users").fetchall()
     ///     >>> print(rows)
     ///     [[1, 'Alice'], [2, 'Bob']]
-    pub fn sql(&self, sql: &str) -> PyResult<PyQueryResult> {
-        self.execute(sql)
+    pub fn sql(&self, sql: &str, py: Python) -> PyResult<PyQueryResult> {
+        self.execute(sql, None, py)
+    }
+
+    /// Execute a SQL query and return the first column of its first row
+    ///
+    /// No result object or row list is built. A bare `SELECT COUNT(*) FROM
+    /// table` is answered from the table's row count without scanning it.
+    ///
+    /// Args:
+    ///     sql (str): SQL query to execute
+    ///     parameters (sequence, optional): Values for the `?` placeholders in `sql`
+    ///
+    /// Returns:
+    ///     int | float | str | None: The value, or None if the query returned no rows
+    ///
+    /// Examples:
+    ///     >>> db.scalar("SELECT COUNT(*) FROM users")
+    ///     2
+    ///     >>> db.scalar("SELECT name FROM users WHERE id = ?", (1,))
+    ///     'Alice'
+    #[pyo3(signature = (sql, parameters=None))]
+    pub fn scalar(&self, sql: &str, parameters: Option<&PyAny>, py: Python) -> PyResult<PyObject> {
+        let result = execute_sql(&self.db, sql, parameters, py)?;
+        match result.first_value() {
+            Some(value) => value_to_pyobject(&value, py),
+            None => Ok(py.None()),
+        }
     }
 
     /// Convert query result to a dictionary
     ///
     /// Args:
     ///     sql (str): SQL query to execute
+    ///     numpy (bool, optional): Return each column as a `numpy.ndarray`
+    ///         instead of a list. Numeric columns without NULLs are copied
+    ///         from the native column buffers into one typed array without
+    ///         creating a Python object per value; integer columns become
+    ///         int64 and DOUBLE columns float64.
     ///
     /// Returns:
     ///     dict: Dictionary with column names as keys
@@ -117,9 +350,13 @@ impl PyPrismDB {
     ///     >>> data = db.to_dict("SELECT * FROM users")
     ///     >>> print(data)
     ///     {'id': [1, 2], 'name': ['Alice', 'Bob']}
-    pub fn to_dict(&self, sql: &str, py: Python) -> PyResult<PyObject> {
-        let result = self.execute(sql)?;
-        result.to_dict(py)
+    ///     >>> data = db.to_dict("SELECT * FROM users", numpy=True)
+    ///     >>> data['id'].dtype
+    ///     dtype('int64')
+    #[pyo3(signature = (sql, numpy=false))]
+    pub fn to_dict(&self, sql: &str, numpy: bool, py: Python) -> PyResult<PyObject> {
+        let result = self.execute(sql, None, py)?;
+        result.to_dict(numpy, py)
     }
 
     /// Close the database connection
@@ -1,9 +1,11 @@
 //! Python cursor class for PrismDB
 
 use pyo3::prelude::*;
-use pyo3::exceptions::PyRuntimeError;
+use std::sync::Arc;
+use crate::database::QueryResult;
 use crate::Database;
-use super::result::PyQueryResult;
+use super::result::{PyBatchIterator, PyQueryResult};
+use super::params::{execute_batch, execute_sql, parse_single_statement};
 
 /// Database cursor for executing queries
 ///
@@ -29,23 +31,14 @@ impl PyCursor {
     ///
     /// Args:
     ///     sql (str): SQL query to execute
-    ///     parameters (tuple, optional): Query parameters (not yet implemented)
-    ///
-    /// Returns:
-    ///     Cursor: Self for method chaining
+    ///     parameters (sequence, optional): Values for the `?` placeholders in `sql`
     ///
     /// Examples:
     ///     >>> cursor.execute("SELECT * FROM users")
     ///     >>> cursor.execute("SELECT * FROM users WHERE id = ?", (1,))
     #[pyo3(signature = (sql, parameters=None))]
-    pub fn execute(&mut self, sql: &str, parameters: Option<Vec<PyObject>>) -> PyResult<()> {
-        if parameters.is_some() {
-            return Err(PyRuntimeError::new_err("Parameterized queries not yet supported"));
-        }
-
-        let result = self.db.execute_sql_collect(sql)
-            .map_err(|e| PyRuntimeError::new_err(format!("Query execution failed: {}", e)))?;
-
+    pub fn execute(&mut self, sql: &str, parameters: Option<&PyAny>, py: Python) -> PyResult<()> {
+        let result = execute_sql(&self.db, sql, parameters, py)?;
         self.last_result = Some(PyQueryResult::new(result));
         Ok(())
     }
@@ -54,17 +47,17 @@ impl PyCursor {
     ///
     /// Args:
     ///     sql (str): SQL query to execute
-    ///     seq_of_parameters (list): List of parameter tuples
+    ///     seq_of_parameters (iterable): Sequence of parameter tuples
     ///
     /// Examples:
     ///     >>> cursor.executemany("INSERT INTO users VALUES (?, ?)",
     ///     ...                    [(1, 'Alice'), (2, 'Bob')])
-    pub fn executemany(&mut self, sql: &str, seq_of_parameters: Vec<Vec<PyObject>>) -> PyResult<()> {
-        if !seq_of_parameters.is_empty() {
-            return Err(PyRuntimeError::new_err("Parameterized queries not yet supported"));
-        }
+    pub fn executemany(&mut self, sql: &str, seq_of_parameters: &PyAny) -> PyResult<()> {
+        let statement = parse_single_statement(&self.db, sql)?;
+        let result = execute_batch(&self.db, &statement, seq_of_parameters)?;
 
-        self.execute(sql, None)
+        self.last_result = Some(PyQueryResult::new(result));
+        Ok(())
     }
 
     /// Fetch the next row from the result set
@@ -122,6 +115,28 @@ impl PyCursor {
         }
     }
 
+    /// Iterate over the last result in batches of columns
+    ///
+    /// Args:
+    ///     size (int, optional): Maximum number of rows per batch. Defaults to 1024.
+    ///     numpy (bool, optional): Return each column as a `numpy.ndarray`
+    ///         instead of a list. Requires numpy to be installed.
+    ///
+    /// Returns:
+    ///     BatchIterator: Iterator of dicts mapping column names to values
+    ///
+    /// Examples:
+    ///     >>> cursor.execute("SELECT * FROM users")
+    ///     >>> for batch in cursor.iter_batches(size=1000):
+    ///     ...     print(len(batch['id']))
+    #[pyo3(signature = (size=1024, numpy=false))]
+    pub fn iter_batches(&self, size: usize, numpy: bool, py: Python) -> PyResult<PyBatchIterator> {
+        match &self.last_result {
+            Some(result) => result.iter_batches(size, numpy, py),
+            None => PyBatchIterator::new(Arc::new(QueryResult::empty()), size, numpy, py),
+        }
+    }
+
     /// Get column descriptions
     ///
     /// Returns:
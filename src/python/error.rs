@@ -26,3 +26,9 @@ pub fn to_py_err(error: PrismDBError) -> PyErr {
         PrismDBError::OutOfMemory => PyRuntimeError::new_err("Out of memory"),
     }
 }
+
+impl From<PrismDBError> for PyErr {
+    fn from(error: PrismDBError) -> Self {
+        to_py_err(error)
+    }
+}
@@ -14,6 +14,10 @@ mod cursor;
 mod result;
 #[cfg(feature = "python")]
 mod error;
+#[cfg(feature = "python")]
+mod params;
+#[cfg(feature = "python")]
+mod statement;
 
 #[cfg(feature = "python")]
 pub use connection::*;
@@ -23,6 +27,8 @@ pub use cursor::*;
 pub use result::*;
 #[cfg(feature = "python")]
 pub use error::*;
+#[cfg(feature = "python")]
+pub use statement::*;
 
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
@@ -34,6 +40,8 @@ fn prismdb(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_class::<PyPrismDB>()?;
     m.add_class::<PyCursor>()?;
     m.add_class::<PyQueryResult>()?;
+    m.add_class::<PyBatchIterator>()?;
+    m.add_class::<PyPreparedStatement>()?;
 
     // Module metadata
     m.add("__version__", env!("CARGO_PKG_VERSION"))?;
@@ -48,7 +56,12 @@ fn prismdb(_py: Python, m: &PyModule) -> PyResult<()> {
 /// Connect to a PrismDB database
 ///
 /// Args:
-///     path (str, optional): Path to database file. If None, creates an in-memory database.
+///     path (str, optional): Path to database file. If None or ":memory:", creates an
+///         in-memory database.
+///     threads (int, optional): Number of worker threads for parallel query execution.
+///         Defaults to the number of CPUs.
+///     plan_cache_dir (str, optional): Directory parsed statements are cached in, so
+///         later connections skip parsing SQL they have seen before.
 ///
 /// Returns:
 ///     PyPrismDB: A connection to the database
@@ -57,9 +70,14 @@ fn prismdb(_py: Python, m: &PyModule) -> PyResult<()> {
 ///     >>> import prismdb
 ///     >>> db = prismdb.connect()  # In-memory
 ///     >>> db = prismdb.connect('mydata.db')  # File-based
+///     >>> db = prismdb.connect(threads=4)  # Four worker threads
 #[cfg(feature = "python")]
 #[pyfunction]
-#[pyo3(signature = (path=None))]
-fn connect(path: Option<String>) -> PyResult<PyPrismDB> {
-    PyPrismDB::new(path)
+#[pyo3(signature = (path=None, threads=None, plan_cache_dir=None))]
+fn connect(
+    path: Option<String>,
+    threads: Option<usize>,
+    plan_cache_dir: Option<String>,
+) -> PyResult<PyPrismDB> {
+    PyPrismDB::new(path, threads, plan_cache_dir)
 }
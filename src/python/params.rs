@@ -0,0 +1,238 @@
+//! Python value conversion and query parameter handling for PrismDB
+
+use pyo3::prelude::*;
+use pyo3::buffer::{Element, PyBuffer};
+use pyo3::exceptions::{PyRuntimeError, PyTypeError, PyValueError};
+use pyo3::types::{PyBool, PyFloat, PyLong, PyString};
+use crate::common::error::PrismDBResult;
+use crate::database::QueryResult;
+use crate::parser::{LiteralValue, QueryParameters, Statement};
+use crate::types::{LogicalType, Value};
+use crate::Database;
+
+/// Convert a Python object to a SQL literal
+fn pyobject_to_literal(obj: &PyAny) -> PyResult<LiteralValue> {
+    if obj.is_none() {
+        return Ok(LiteralValue::Null);
+    }
+    // bool is a subclass of int, so it must be checked first
+    if let Ok(b) = obj.downcast::<PyBool>() {
+        return Ok(LiteralValue::Boolean(b.is_true()));
+    }
+    if obj.is_instance_of::<PyLong>() {
+        return Ok(LiteralValue::Integer(obj.extract::<i64>()?));
+    }
+    if obj.is_instance_of::<PyFloat>() {
+        return Ok(LiteralValue::Float(obj.extract::<f64>()?));
+    }
+    if let Ok(s) = obj.downcast::<PyString>() {
+        return Ok(LiteralValue::String(s.to_str()?.to_string()));
+    }
+    Err(PyTypeError::new_err(format!(
+        "Unsupported parameter type: {}",
+        obj.get_type().name()?
+    )))
+}
+
+/// Convert a Python object to a value of the given column type
+pub(crate) fn pyobject_to_value(obj: &PyAny, data_type: &LogicalType) -> PyResult<Value> {
+    if obj.is_none() {
+        return Ok(Value::Null);
+    }
+    let value = match data_type {
+        LogicalType::Boolean => Value::Boolean(obj.extract::<bool>()?),
+        LogicalType::TinyInt => Value::TinyInt(obj.extract::<i8>()?),
+        LogicalType::SmallInt => Value::SmallInt(obj.extract::<i16>()?),
+        LogicalType::Integer => Value::Integer(obj.extract::<i32>()?),
+        LogicalType::BigInt => Value::BigInt(obj.extract::<i64>()?),
+        LogicalType::Float => Value::Float(obj.extract::<f32>()?),
+        LogicalType::Double => Value::Double(obj.extract::<f64>()?),
+        LogicalType::Varchar | LogicalType::Text => Value::Varchar(obj.extract::<String>()?),
+        LogicalType::Blob => Value::Blob(obj.extract::<Vec<u8>>()?),
+        other => Value::Varchar(obj.str()?.to_str()?.to_string())
+            .cast_to(other)
+            .map_err(|e| PyValueError::new_err(format!("{}", e)))?,
+    };
+    Ok(value)
+}
+
+/// Whether values of `data_type` can be read from a numeric buffer
+pub(crate) fn is_numeric_type(data_type: &LogicalType) -> bool {
+    matches!(
+        data_type,
+        LogicalType::TinyInt
+            | LogicalType::SmallInt
+            | LogicalType::Integer
+            | LogicalType::BigInt
+            | LogicalType::Float
+            | LogicalType::Double
+    )
+}
+
+/// Read a one-dimensional buffer of `T` into values built by `to_value`
+///
+/// Returns `None` when `obj` does not expose such a buffer.
+fn read_buffer<T: Element + Copy>(obj: &PyAny, to_value: fn(T) -> Value) -> PyResult<Option<Vec<Value>>> {
+    let buffer = match PyBuffer::<T>::get(obj) {
+        Ok(buffer) => buffer,
+        Err(_) => return Ok(None),
+    };
+    if buffer.dimensions() != 1 {
+        return Ok(None);
+    }
+    Ok(Some(buffer.to_vec(obj.py())?.into_iter().map(to_value).collect()))
+}
+
+/// Convert a numeric buffer, such as a numpy array, to values of the given column type
+///
+/// The buffer is copied out natively without creating a Python object per
+/// element; elements of a different numeric type are cast in Rust. Returns
+/// `None` when `obj` is not a one-dimensional numeric buffer, so the caller
+/// can fall back to converting element by element.
+pub(crate) fn buffer_to_values(obj: &PyAny, data_type: &LogicalType) -> PyResult<Option<Vec<Value>>> {
+    if !is_numeric_type(data_type) {
+        return Ok(None);
+    }
+    let readers: [fn(&PyAny) -> PyResult<Option<Vec<Value>>>; 6] = [
+        |obj| read_buffer::<i64>(obj, Value::BigInt),
+        |obj| read_buffer::<i32>(obj, Value::Integer),
+        |obj| read_buffer::<i16>(obj, Value::SmallInt),
+        |obj| read_buffer::<i8>(obj, Value::TinyInt),
+        |obj| read_buffer::<f64>(obj, Value::Double),
+        |obj| read_buffer::<f32>(obj, Value::Float),
+    ];
+    for reader in readers {
+        let values = match reader(obj)? {
+            Some(values) => values,
+            None => continue,
+        };
+        if values.first().map_or(true, |value| value.get_type() == *data_type) {
+            return Ok(Some(values));
+        }
+        return values
+            .iter()
+            .map(|value| value.cast_to(data_type))
+            .collect::<PrismDBResult<Vec<_>>>()
+            .map(Some)
+            .map_err(|e| PyValueError::new_err(format!("{}", e)));
+    }
+    Ok(None)
+}
+
+/// Convert a Python parameter sequence to positional query parameters
+fn convert_parameters(params: &PyAny) -> PyResult<QueryParameters> {
+    let mut query_params = QueryParameters::new();
+    for (index, item) in params.iter()?.enumerate() {
+        query_params.set_parameter(index, pyobject_to_literal(item?)?);
+    }
+    Ok(query_params)
+}
+
+/// Check that a statement using `expected` parameters was given all of them
+fn check_parameter_count(expected: usize, query_params: &QueryParameters) -> PyResult<()> {
+    let supplied = query_params.parameters.len();
+    if supplied != expected {
+        return Err(PyValueError::new_err(format!(
+            "Incorrect number of bindings supplied: the statement uses {}, and {} were supplied",
+            expected, supplied
+        )));
+    }
+    Ok(())
+}
+
+/// Convert a Python parameter sequence and check it against the statement
+///
+/// `expected` is the statement's `parameter_count()`, which callers compute
+/// once rather than per parameter set since it walks a copy of the statement.
+fn to_query_parameters(expected: usize, params: &PyAny) -> PyResult<QueryParameters> {
+    let query_params = convert_parameters(params)?;
+    check_parameter_count(expected, &query_params)?;
+    Ok(query_params)
+}
+
+/// Parse a SQL string that must contain exactly one statement
+pub(crate) fn parse_single_statement(db: &Database, sql: &str) -> PyResult<Statement> {
+    let mut statements = db.parse_sql(sql)
+        .map_err(|e| PyRuntimeError::new_err(format!("Query execution failed: {}", e)))?;
+    if statements.len() != 1 {
+        return Err(PyValueError::new_err(
+            "Parameterized execution requires exactly one SQL statement",
+        ));
+    }
+    Ok(statements.remove(0))
+}
+
+/// Run `f` against `db` with the GIL released
+///
+/// Parsing, parameter binding, planning and execution happen here, so other
+/// Python threads keep running while a query executes. Python objects are
+/// converted beforehand and only built again afterwards, once the GIL has
+/// been reacquired.
+pub(crate) fn run_without_gil<T, F>(py: Python, db: &Database, f: F) -> PyResult<T>
+where
+    T: Send,
+    F: FnOnce(&Database) -> PrismDBResult<T> + Send,
+{
+    let db = db.clone();
+    py.allow_threads(move || f(&db))
+        .map_err(|e| PyRuntimeError::new_err(format!("Query execution failed: {}", e)))
+}
+
+/// Bind one parameter sequence to a statement and execute it
+pub(crate) fn execute_with_parameters(
+    db: &Database,
+    statement: &Statement,
+    parameter_count: usize,
+    params: &PyAny,
+) -> PyResult<QueryResult> {
+    let query_params = to_query_parameters(parameter_count, params)?;
+    run_without_gil(params.py(), db, move |db| {
+        let bound = statement.bind_parameters(&query_params)?;
+        db.execute_statement(&bound)
+    })
+}
+
+/// Execute `sql`, binding `parameters` to its placeholders when given
+pub(crate) fn execute_sql(
+    db: &Database,
+    sql: &str,
+    parameters: Option<&PyAny>,
+    py: Python,
+) -> PyResult<QueryResult> {
+    match parameters {
+        Some(params) => {
+            // Only the conversion from Python objects needs the GIL
+            let query_params = convert_parameters(params)?;
+            let db = db.clone();
+            let sql = sql.to_string();
+            py.allow_threads(move || {
+                let statement = parse_single_statement(&db, &sql)?;
+                check_parameter_count(statement.parameter_count(), &query_params)?;
+                statement.bind_parameters(&query_params)
+                    .and_then(|bound| db.execute_statement(&bound))
+                    .map_err(|e| PyRuntimeError::new_err(format!("Query execution failed: {}", e)))
+            })
+        }
+        None => {
+            let sql = sql.to_string();
+            run_without_gil(py, db, move |db| db.execute_sql_collect(&sql))
+        }
+    }
+}
+
+/// Execute a statement once for every parameter sequence in `seq_of_parameters`
+pub(crate) fn execute_batch(
+    db: &Database,
+    statement: &Statement,
+    seq_of_parameters: &PyAny,
+) -> PyResult<QueryResult> {
+    let parameter_count = statement.parameter_count();
+    let mut param_sets = Vec::new();
+    for params in seq_of_parameters.iter()? {
+        param_sets.push(to_query_parameters(parameter_count, params?)?);
+    }
+    let statement = statement.clone();
+    run_without_gil(seq_of_parameters.py(), db, move |db| {
+        db.execute_statement_batch(&statement, &param_sets)
+    })
+}
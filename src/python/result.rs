@@ -1,33 +1,386 @@
 //! Python query result class for PrismDB
 
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList};
+use pyo3::exceptions::PyValueError;
+use pyo3::types::{PyByteArray, PyDict, PyList, PyString};
 use crate::database::QueryResult;
-use crate::types::Value;
+use crate::types::{LogicalType, Value, Vector};
 use std::cell::RefCell;
+use std::collections::HashMap;
+use std::ops::Range;
+use std::sync::Arc;
 
 /// Query result wrapper for Python
 #[pyclass(name = "QueryResult")]
 pub struct PyQueryResult {
-    pub(crate) result: QueryResult,
+    pub(crate) result: Arc<QueryResult>,
     pub(crate) current_row: RefCell<usize>,
+    /// VARCHAR columns of the chunk the fetch position is in
+    decoded: RefCell<Option<DecodedChunk>>,
+}
+
+/// VARCHAR columns of one result chunk, converted to Python strings
+///
+/// Kept across fetches so row-at-a-time iteration decodes each chunk once
+/// instead of once per row.
+struct DecodedChunk {
+    index: usize,
+    /// Python strings for each VARCHAR column, `None` for other columns
+    columns: Vec<Option<Vec<PyObject>>>,
+}
+
+impl DecodedChunk {
+    fn new(index: usize, vectors: &[&Vector], py: Python) -> Self {
+        let mut strings = StringCache::new();
+        let columns = vectors
+            .iter()
+            .map(|vector| {
+                varchar_slices(vector)
+                    .map(|slices| slices.into_iter().map(|bytes| strings.get(bytes, py)).collect())
+            })
+            .collect();
+        Self { index, columns }
+    }
 }
 
 impl PyQueryResult {
     pub fn new(result: QueryResult) -> Self {
         Self {
-            result,
+            result: Arc::new(result),
             current_row: RefCell::new(0),
+            decoded: RefCell::new(None),
         }
     }
 
     pub fn row_count(&self) -> usize {
         self.result.row_count()
     }
+
+    /// Materialize up to `count` rows from the current position and advance past them
+    ///
+    /// Chunks before the current position are skipped by length, and each
+    /// chunk's vectors are looked up once per batch rather than once per row.
+    /// VARCHAR columns are decoded once per chunk and kept until the fetch
+    /// position leaves that chunk, and repeated strings share one Python
+    /// object.
+    fn fetch_rows(&self, count: usize, py: Python) -> PyResult<Vec<PyObject>> {
+        let mut current = self.current_row.borrow_mut();
+        let mut decoded = self.decoded.borrow_mut();
+        let remaining = self.result.row_count().saturating_sub(*current);
+        let mut rows = Vec::with_capacity(count.min(remaining));
+
+        let mut offset = *current;
+        for (chunk_idx, chunk) in self.result.chunks().iter().enumerate() {
+            if rows.len() >= count {
+                break;
+            }
+            if offset >= chunk.len() {
+                offset -= chunk.len();
+                continue;
+            }
+
+            let vectors: Vec<_> = (0..chunk.column_count())
+                .filter_map(|col_idx| chunk.get_vector(col_idx))
+                .collect();
+            let columns = match &mut *decoded {
+                Some(chunk_strings) if chunk_strings.index == chunk_idx => &chunk_strings.columns,
+                slot => &slot.insert(DecodedChunk::new(chunk_idx, &vectors, py)).columns,
+            };
+            let end = chunk.len().min(offset + (count - rows.len()));
+
+            for row_idx in offset..end {
+                let mut row = Vec::with_capacity(vectors.len());
+                for (vector, strings) in vectors.iter().zip(columns) {
+                    match strings {
+                        Some(strings) => row.push(strings[row_idx].clone_ref(py)),
+                        None => row.push(value_to_pyobject(&vector.get_value(row_idx)?, py)?),
+                    }
+                }
+                rows.push(PyList::new(py, row).to_object(py));
+            }
+            offset = 0;
+        }
+
+        *current += rows.len();
+        Ok(rows)
+    }
+
+    /// Build a dict of numpy arrays, one per column
+    fn to_numpy_dict(&self, py: Python) -> PyResult<PyObject> {
+        let numpy = py.import("numpy")?;
+        columns_to_dict(&self.result, 0..self.result.row_count(), Some(numpy), py)
+    }
+}
+
+/// Vector segments holding rows `rows` of result column `col_idx`
+fn column_segments(result: &QueryResult, col_idx: usize, rows: Range<usize>) -> Vec<(&Vector, Range<usize>)> {
+    let mut segments = Vec::new();
+    let mut chunk_start = 0;
+    for chunk in result.chunks() {
+        let chunk_end = chunk_start + chunk.len();
+        if chunk_end > rows.start && chunk_start < rows.end {
+            if let Some(vector) = chunk.get_vector(col_idx) {
+                let start = rows.start.saturating_sub(chunk_start);
+                let end = rows.end.min(chunk_end) - chunk_start;
+                segments.push((vector, start..end));
+            }
+        }
+        if chunk_end >= rows.end {
+            break;
+        }
+        chunk_start = chunk_end;
+    }
+    segments
+}
+
+/// Build a dict mapping each column name to its values in `rows`
+///
+/// Columns are assembled one at a time from the chunks' vectors. With
+/// `numpy`, each column becomes a `numpy.ndarray`, otherwise a list.
+pub(crate) fn columns_to_dict(
+    result: &QueryResult,
+    rows: Range<usize>,
+    numpy: Option<&PyModule>,
+    py: Python,
+) -> PyResult<PyObject> {
+    let dict = PyDict::new(py);
+    for (col_idx, col) in result.columns.iter().enumerate() {
+        let segments = column_segments(result, col_idx, rows.clone());
+        let column = match numpy {
+            Some(numpy) => segments_to_numpy(&segments, &col.data_type, numpy, py)?,
+            None => segments_to_list(&segments, py)?,
+        };
+        dict.set_item(&col.name, column)?;
+    }
+    Ok(dict.to_object(py))
+}
+
+/// Convert column segments to a Python list
+fn segments_to_list(segments: &[(&Vector, Range<usize>)], py: Python) -> PyResult<PyObject> {
+    let mut values = Vec::with_capacity(segments.iter().map(|(_, rows)| rows.len()).sum());
+    let mut strings = StringCache::new();
+    for (vector, rows) in segments {
+        if let Some(slices) = varchar_slices(vector) {
+            values.extend(slices[rows.clone()].iter().map(|&bytes| strings.get(bytes, py)));
+        } else if !extend_native(&mut values, vector, rows.clone(), py) {
+            for row_idx in rows.clone() {
+                values.push(value_to_pyobject(&vector.get_value(row_idx)?, py)?);
+            }
+        }
+    }
+    Ok(PyList::new(py, values).to_object(py))
+}
+
+/// Decode a VARCHAR vector's strings in one pass, or `None` for other types
+fn varchar_slices(vector: &Vector) -> Option<Vec<Option<&[u8]>>> {
+    match vector.get_type() {
+        LogicalType::Varchar => vector.string_slices(),
+        _ => None,
+    }
+}
+
+/// Maximum number of distinct strings a `StringCache` keeps
+const MAX_CACHED_STRINGS: usize = 1024;
+
+/// Python strings built during one conversion, keyed by their bytes
+///
+/// Columns such as region or category names repeat a handful of values,
+/// so every occurrence after the first reuses the same `str` object instead
+/// of allocating a new one. Once the cache is full, further distinct values
+/// are converted without being cached.
+struct StringCache<'a> {
+    strings: HashMap<&'a [u8], PyObject>,
+}
+
+impl<'a> StringCache<'a> {
+    fn new() -> Self {
+        Self {
+            strings: HashMap::new(),
+        }
+    }
+
+    /// Python object for a string cell, `None` for NULL
+    fn get(&mut self, bytes: Option<&'a [u8]>, py: Python) -> PyObject {
+        let bytes = match bytes {
+            Some(bytes) => bytes,
+            None => return py.None(),
+        };
+        if let Some(string) = self.strings.get(bytes) {
+            return string.clone_ref(py);
+        }
+        let string: PyObject = PyString::new(py, &String::from_utf8_lossy(bytes)).into();
+        if self.strings.len() < MAX_CACHED_STRINGS {
+            self.strings.insert(bytes, string.clone_ref(py));
+        }
+        string
+    }
+}
+
+/// Box rows `rows` of a null-free fixed-width vector straight from its buffer
+///
+/// Skips the intermediate `Value` per cell. Returns false, leaving `values`
+/// untouched, when the rows contain NULLs or the type has no native layout.
+fn extend_native(values: &mut Vec<PyObject>, vector: &Vector, rows: Range<usize>, py: Python) -> bool {
+    let size = match vector.get_physical_type().get_size() {
+        Some(size) => size,
+        None => return false,
+    };
+    let data = match vector.fixed_width_data() {
+        Some(data) => &data[rows.start * size..rows.end * size],
+        None => return false,
+    };
+    if !rows.clone().all(|i| vector.is_valid(i)) {
+        return false;
+    }
+
+    match vector.get_type() {
+        LogicalType::Boolean => values.extend(data.iter().map(|&b| (b != 0).to_object(py))),
+        LogicalType::TinyInt => values.extend(data.iter().map(|&b| (b as i8).to_object(py))),
+        LogicalType::SmallInt => values.extend(
+            data.chunks_exact(2)
+                .map(|b| i16::from_le_bytes([b[0], b[1]]).to_object(py)),
+        ),
+        LogicalType::Integer => values.extend(
+            data.chunks_exact(4)
+                .map(|b| i32::from_le_bytes([b[0], b[1], b[2], b[3]]).to_object(py)),
+        ),
+        LogicalType::BigInt => values.extend(
+            data.chunks_exact(8)
+                .map(|b| i64::from_le_bytes([b[0], b[1], b[2], b[3], b[4], b[5], b[6], b[7]]).to_object(py)),
+        ),
+        LogicalType::Float => values.extend(
+            data.chunks_exact(4)
+                .map(|b| f32::from_le_bytes([b[0], b[1], b[2], b[3]]).to_object(py)),
+        ),
+        LogicalType::Double => values.extend(
+            data.chunks_exact(8)
+                .map(|b| f64::from_le_bytes([b[0], b[1], b[2], b[3], b[4], b[5], b[6], b[7]]).to_object(py)),
+        ),
+        _ => return false,
+    }
+    true
+}
+
+/// Convert column segments to a numpy array
+///
+/// Null-free fixed-width numeric columns are copied once from the vectors'
+/// native buffers into a `bytearray` that the typed array is a view of,
+/// without creating a Python object per value. Integers are widened to
+/// int64 while copying. Other columns become object arrays.
+fn segments_to_numpy(
+    segments: &[(&Vector, Range<usize>)],
+    data_type: &LogicalType,
+    numpy: &PyModule,
+    py: Python,
+) -> PyResult<PyObject> {
+    if let Some(dtype) = numpy_dtype(data_type) {
+        let is_native = segments.iter().all(|(v, rows)| {
+            v.get_type() == data_type && rows.clone().all(|i| v.is_valid(i))
+        });
+        if is_native {
+            let (dtype, width) = dtype;
+            let row_count: usize = segments.iter().map(|(_, rows)| rows.len()).sum();
+            let bytes = PyByteArray::new_with(py, row_count * width, |buffer| {
+                let mut pos = 0;
+                for (vector, rows) in segments {
+                    if let (Some(data), Some(size)) = (vector.fixed_width_data(), vector.get_physical_type().get_size()) {
+                        let data = &data[rows.start * size..rows.end * size];
+                        if size == width {
+                            buffer[pos..pos + data.len()].copy_from_slice(data);
+                            pos += data.len();
+                            continue;
+                        }
+                        // Sign-extend narrower integers to int64
+                        for cell in data.chunks_exact(size) {
+                            let value = match cell {
+                                &[b0] => b0 as i8 as i64,
+                                &[b0, b1] => i16::from_le_bytes([b0, b1]) as i64,
+                                &[b0, b1, b2, b3] => i32::from_le_bytes([b0, b1, b2, b3]) as i64,
+                                _ => unreachable!("only integers narrower than int64 are widened"),
+                            };
+                            buffer[pos..pos + width].copy_from_slice(&value.to_le_bytes());
+                            pos += width;
+                        }
+                    }
+                }
+                Ok(())
+            })?;
+            return Ok(numpy.call_method1("frombuffer", (bytes, dtype))?.to_object(py));
+        }
+    }
+
+    let kwargs = PyDict::new(py);
+    kwargs.set_item("dtype", "object")?;
+    Ok(numpy.call_method("array", (segments_to_list(segments, py)?,), Some(kwargs))?.to_object(py))
+}
+
+/// Iterator over a query result in batches of columns
+///
+/// Returned by `QueryResult.iter_batches()` and `Cursor.iter_batches()`.
+#[pyclass(name = "BatchIterator")]
+pub struct PyBatchIterator {
+    result: Arc<QueryResult>,
+    position: usize,
+    size: usize,
+    numpy: Option<Py<PyModule>>,
+}
+
+impl PyBatchIterator {
+    pub(crate) fn new(result: Arc<QueryResult>, size: usize, numpy: bool, py: Python) -> PyResult<Self> {
+        if size == 0 {
+            return Err(PyValueError::new_err("Batch size must be at least 1"));
+        }
+        let numpy = if numpy { Some(py.import("numpy")?.into()) } else { None };
+        Ok(Self {
+            result,
+            position: 0,
+            size,
+            numpy,
+        })
+    }
+}
+
+#[pymethods]
+impl PyBatchIterator {
+    /// Iterator support
+    fn __iter__(slf: PyRef<Self>) -> PyRef<Self> {
+        slf
+    }
+
+    /// Next batch: a dict of column name to values
+    fn __next__(&mut self, py: Python) -> PyResult<Option<PyObject>> {
+        let total = self.result.row_count();
+        if self.position >= total {
+            return Ok(None);
+        }
+        let end = total.min(self.position + self.size);
+        let numpy = self.numpy.as_ref().map(|numpy| numpy.as_ref(py));
+        let batch = columns_to_dict(&self.result, self.position..end, numpy, py)?;
+        self.position = end;
+        Ok(Some(batch))
+    }
+}
+
+/// numpy dtype and element width for column types whose vector storage is a
+/// plain little-endian array
+///
+/// Every integer type maps to int64, so integer columns have one dtype
+/// whatever their declared width.
+fn numpy_dtype(data_type: &LogicalType) -> Option<(&'static str, usize)> {
+    match data_type {
+        LogicalType::Boolean => Some(("?", 1)),
+        LogicalType::TinyInt
+        | LogicalType::SmallInt
+        | LogicalType::Integer
+        | LogicalType::BigInt => Some(("<i8", 8)),
+        LogicalType::Float => Some(("<f4", 4)),
+        LogicalType::Double => Some(("<f8", 8)),
+        _ => None,
+    }
 }
 
 /// Convert a PrismDB Value to a Python object
-fn value_to_pyobject(value: &Value, py: Python) -> PyResult<PyObject> {
+pub(crate) fn value_to_pyobject(value: &Value, py: Python) -> PyResult<PyObject> {
     match value {
         Value::Null => Ok(py.None()),
         Value::Boolean(b) => Ok(b.to_object(py)),
@@ -62,31 +415,7 @@ impl PyQueryResult {
     /// Returns:
     ///     list or None: Next row as a list, or None if no more rows
     pub fn fetchone(&self, py: Python) -> PyResult<Option<PyObject>> {
-        let mut current = self.current_row.borrow_mut();
-        if *current >= self.result.row_count() {
-            return Ok(None);
-        }
-
-        let row_list = PyList::empty(py);
-        for chunk in self.result.chunks() {
-            if *current >= chunk.len() {
-                *current -= chunk.len();
-                continue;
-            }
-
-            for col_idx in 0..chunk.column_count() {
-                if let Some(vector) = chunk.get_vector(col_idx) {
-                    if let Ok(value) = vector.get_value(*current) {
-                        row_list.append(value_to_pyobject(&value, py)?)?;
-                    }
-                }
-            }
-
-            *current = *current + 1;
-            return Ok(Some(row_list.to_object(py)));
-        }
-
-        Ok(None)
+        Ok(self.fetch_rows(1, py)?.pop())
     }
 
     /// Fetch multiple rows
@@ -98,18 +427,7 @@ impl PyQueryResult {
     ///     list: List of rows
     #[pyo3(signature = (size=None))]
     pub fn fetchmany(&self, size: Option<usize>, py: Python) -> PyResult<Vec<PyObject>> {
-        let count = size.unwrap_or(self.result.row_count());
-        let mut rows = Vec::new();
-
-        for _ in 0..count {
-            if let Some(row) = self.fetchone(py)? {
-                rows.push(row);
-            } else {
-                break;
-            }
-        }
-
-        Ok(rows)
+        self.fetch_rows(size.unwrap_or(self.result.row_count()), py)
     }
 
     /// Fetch all remaining rows
@@ -117,63 +435,43 @@ impl PyQueryResult {
     /// Returns:
     ///     list: List of all rows
     pub fn fetchall(&self, py: Python) -> PyResult<Vec<PyObject>> {
-        let mut rows = Vec::new();
-        let mut row_idx = 0;
-
-        for chunk in self.result.chunks() {
-            for i in 0..chunk.len() {
-                let row_list = PyList::empty(py);
-
-                for col_idx in 0..chunk.column_count() {
-                    if let Some(vector) = chunk.get_vector(col_idx) {
-                        if let Ok(value) = vector.get_value(i) {
-                            row_list.append(value_to_pyobject(&value, py)?)?;
-                        }
-                    }
-                }
-
-                rows.push(row_list.to_object(py));
-                row_idx += 1;
-            }
-        }
-
-        // Update current row to the end
-        *self.current_row.borrow_mut() = row_idx;
-
-        Ok(rows)
+        self.fetch_rows(self.result.row_count(), py)
     }
 
     /// Convert result to a dictionary
     ///
+    /// Args:
+    ///     numpy (bool, optional): Return each column as a `numpy.ndarray`
+    ///         instead of a list. Requires numpy to be installed.
+    ///
     /// Returns:
     ///     dict: Dictionary with column names as keys and lists of values
-    pub fn to_dict(&self, py: Python) -> PyResult<PyObject> {
-        let dict = PyDict::new(py);
-
-        // Initialize column lists
-        for col in &self.result.columns {
-            dict.set_item(&col.name, PyList::empty(py))?;
-        }
-
-        // Fill data
-        for chunk in self.result.chunks() {
-            for row_idx in 0..chunk.len() {
-                for (col_idx, col) in self.result.columns.iter().enumerate() {
-                    if let Some(vector) = chunk.get_vector(col_idx) {
-                        if let Ok(value) = vector.get_value(row_idx) {
-                            let py_value = value_to_pyobject(&value, py)?;
-                            if let Ok(Some(list)) = dict.get_item(&col.name) {
-                                if let Ok(py_list) = list.downcast::<PyList>() {
-                                    py_list.append(py_value)?;
-                                }
-                            }
-                        }
-                    }
-                }
-            }
+    #[pyo3(signature = (numpy=false))]
+    pub fn to_dict(&self, numpy: bool, py: Python) -> PyResult<PyObject> {
+        if numpy {
+            return self.to_numpy_dict(py);
         }
 
-        Ok(dict.to_object(py))
+        columns_to_dict(&self.result, 0..self.result.row_count(), None, py)
+    }
+
+    /// Iterate over the result in batches of columns
+    ///
+    /// Each batch is a dict mapping column names to the values of up to
+    /// `size` rows, assembled column by column from the result's chunks.
+    /// Iteration always starts at the first row and does not move the
+    /// fetch position.
+    ///
+    /// Args:
+    ///     size (int, optional): Maximum number of rows per batch. Defaults to 1024.
+    ///     numpy (bool, optional): Return each column as a `numpy.ndarray`
+    ///         instead of a list. Requires numpy to be installed.
+    ///
+    /// Returns:
+    ///     BatchIterator: Iterator of dicts
+    #[pyo3(signature = (size=1024, numpy=false))]
+    pub fn iter_batches(&self, size: usize, numpy: bool, py: Python) -> PyResult<PyBatchIterator> {
+        PyBatchIterator::new(self.result.clone(), size, numpy, py)
     }
 
     /// Get column descriptions
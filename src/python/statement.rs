@@ -0,0 +1,83 @@
+//! Python prepared statement class for PrismDB
+
+use pyo3::prelude::*;
+use pyo3::types::PyTuple;
+use crate::parser::Statement;
+use crate::Database;
+use super::params::{execute_batch, execute_with_parameters};
+use super::result::PyQueryResult;
+
+/// A parsed SQL statement that can be executed repeatedly
+///
+/// The SQL text is tokenized and parsed once by `Connection.prepare()`;
+/// each execution only binds the `?` parameters and runs the statement.
+#[pyclass(name = "PreparedStatement")]
+pub struct PyPreparedStatement {
+    pub(crate) db: Database,
+    pub(crate) sql: String,
+    pub(crate) statement: Statement,
+    /// Number of `?` placeholders, counted once at prepare time
+    pub(crate) parameter_count: usize,
+}
+
+impl PyPreparedStatement {
+    pub fn new(db: Database, sql: String, statement: Statement) -> Self {
+        let parameter_count = statement.parameter_count();
+        Self { db, sql, statement, parameter_count }
+    }
+}
+
+#[pymethods]
+impl PyPreparedStatement {
+    /// Execute the statement with one set of parameters
+    ///
+    /// Args:
+    ///     parameters (sequence, optional): Values for the `?` placeholders
+    ///
+    /// Returns:
+    ///     QueryResult: Query results
+    ///
+    /// Examples:
+    ///     >>> stmt = db.prepare("SELECT name FROM users WHERE id = ?")
+    ///     >>> stmt.execute((1,)).fetchall()
+    ///     [['Alice']]
+    #[pyo3(signature = (parameters=None))]
+    pub fn execute(&self, parameters: Option<&PyAny>, py: Python) -> PyResult<PyQueryResult> {
+        let params = parameters.unwrap_or_else(|| PyTuple::empty(py).as_ref());
+        let result = execute_with_parameters(&self.db, &self.statement, self.parameter_count, params)?;
+        Ok(PyQueryResult::new(result))
+    }
+
+    /// Execute the statement once for each parameter set
+    ///
+    /// `INSERT ... VALUES` statements are combined into a single multi-row
+    /// insert.
+    ///
+    /// Args:
+    ///     seq_of_parameters (iterable): Sequence of parameter tuples
+    ///
+    /// Examples:
+    ///     >>> ins = db.prepare("INSERT INTO users VALUES (?, ?)")
+    ///     >>> ins.executemany([(1, 'Alice'), (2, 'Bob')])
+    pub fn executemany(&self, seq_of_parameters: &PyAny) -> PyResult<()> {
+        execute_batch(&self.db, &self.statement, seq_of_parameters)?;
+        Ok(())
+    }
+
+    /// Number of `?` placeholders in the statement
+    #[getter]
+    pub fn parameter_count(&self) -> usize {
+        self.parameter_count
+    }
+
+    /// SQL text the statement was prepared from
+    #[getter]
+    pub fn sql(&self) -> String {
+        self.sql.clone()
+    }
+
+    /// String representation
+    fn __repr__(&self) -> String {
+        format!("PreparedStatement({:?})", self.sql)
+    }
+}
@@ -136,6 +136,20 @@ impl ColumnData {
         Ok(())
     }
 
+    /// Append a batch of values to the end of the column
+    pub fn append_values(&mut self, values: Vec<Value>) -> PrismDBResult<()> {
+        if self.values.len() + values.len() > self.capacity {
+            return Err(PrismDBError::InvalidValue(
+                "Column capacity exceeded".to_string(),
+            ));
+        }
+
+        self.null_mask.extend(values.iter().map(|value| value.is_null()));
+        self.values.extend(values);
+
+        Ok(())
+    }
+
     /// Delete a value by index (mark as null)
     pub fn delete_value(&mut self, index: usize) -> PrismDBResult<()> {
         if index >= self.values.len() {
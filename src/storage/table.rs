@@ -178,6 +178,22 @@ impl TableStatistics {
         self.update_estimated_size();
     }
 
+    pub fn update_for_bulk_insert(&mut self, columns: &[Vec<Value>], row_count: usize) {
+        self.row_count += row_count;
+        self.inserts_since_update += row_count;
+        self.mark_dirty();
+
+        for (i, values) in columns.iter().enumerate() {
+            if i < self.column_stats.len() {
+                for value in values {
+                    self.column_stats[i].update_for_value(value);
+                }
+            }
+        }
+
+        self.update_estimated_size();
+    }
+
     pub fn update_for_delete(&mut self) {
         if self.row_count > 0 {
             self.row_count -= 1;
@@ -460,11 +476,7 @@ impl TableData {
             )));
         }
 
-        if self.row_count >= self.capacity {
-            return Err(PrismDBError::InvalidValue(
-                "Table capacity exceeded".to_string(),
-            ));
-        }
+        self.reserve_rows(1)?;
 
         // Insert values into each column
         for (i, value) in row.iter().enumerate() {
@@ -486,6 +498,59 @@ impl TableData {
         Ok(row_id)
     }
 
+    /// Grow capacity to fit `additional` more rows
+    ///
+    /// Capacity at least doubles whenever it grows, so inserts that follow
+    /// a bulk load keep amortized constant cost.
+    fn reserve_rows(&mut self, additional: usize) -> PrismDBResult<()> {
+        let needed = self.row_count + additional;
+        if needed <= self.capacity {
+            return Ok(());
+        }
+        self.resize(needed.max(self.capacity.saturating_mul(2)))
+    }
+
+    /// Append column-oriented data to the table
+    ///
+    /// Each entry of `columns` holds all new values for the corresponding
+    /// table column. Every column is locked and extended once, rather than
+    /// once per row, and capacity is grown to fit the batch.
+    pub fn append_columns(&mut self, columns: Vec<Vec<Value>>) -> PrismDBResult<usize> {
+        if columns.len() != self.columns.len() {
+            return Err(PrismDBError::InvalidValue(format!(
+                "Batch has {} columns but table has {} columns",
+                columns.len(),
+                self.columns.len()
+            )));
+        }
+
+        let row_count = columns.first().map_or(0, |values| values.len());
+        if let Some(values) = columns.iter().find(|values| values.len() != row_count) {
+            return Err(PrismDBError::InvalidValue(format!(
+                "All columns must have the same length (expected {}, got {})",
+                row_count,
+                values.len()
+            )));
+        }
+
+        self.reserve_rows(row_count)?;
+
+        self.info.statistics.update_for_bulk_insert(&columns, row_count);
+
+        for (i, values) in columns.into_iter().enumerate() {
+            let mut column_data = self.columns[i]
+                .write()
+                .map_err(|_| PrismDBError::Internal("Column lock poisoned".to_string()))?;
+            column_data.append_values(values)?;
+        }
+
+        self.row_count += row_count;
+        self.deleted_rows
+            .extend(std::iter::repeat(false).take(row_count));
+
+        Ok(row_count)
+    }
+
     /// Get a row from the table
     pub fn get_row(&self, row_id: usize) -> PrismDBResult<Vec<Value>> {
         if row_id >= self.row_count {
@@ -899,4 +964,42 @@ mod tests {
 
         Ok(())
     }
+
+    #[test]
+    fn test_append_columns() -> PrismDBResult<()> {
+        let mut table_info = TableInfo::new("test".to_string());
+        table_info
+            .add_column(ColumnInfo::new("id".to_string(), LogicalType::Integer, 0))
+            .unwrap();
+        table_info
+            .add_column(ColumnInfo::new("name".to_string(), LogicalType::Varchar, 1))
+            .unwrap();
+
+        let mut table = TableData::new(table_info, 2)?;
+
+        // Appending past the initial capacity grows the table
+        let appended = table.append_columns(vec![
+            vec![Value::integer(1), Value::integer(2), Value::integer(3)],
+            vec![
+                Value::varchar("Alice".to_string()),
+                Value::Null,
+                Value::varchar("Charlie".to_string()),
+            ],
+        ])?;
+        assert_eq!(appended, 3);
+        assert_eq!(table.row_count(), 3);
+        assert_eq!(table.get_row(1)?, vec![Value::integer(2), Value::Null]);
+
+        // Row inserts after a bulk load grow the table as well
+        table.insert_row(&[Value::integer(4), Value::varchar("Diana".to_string())])?;
+        assert_eq!(table.row_count(), 4);
+        assert!(table.capacity >= 6);
+
+        // Ragged batches are rejected
+        assert!(table
+            .append_columns(vec![vec![Value::integer(4)], vec![]])
+            .is_err());
+
+        Ok(())
+    }
 }
@@ -475,6 +475,19 @@ impl Vector {
         Ok(vector)
     }
 
+    /// Create a null-free BOOLEAN vector directly from a slice of bools
+    pub fn from_booleans(values: &[bool]) -> Self {
+        Self {
+            logical_type: LogicalType::Boolean,
+            physical_type: LogicalType::Boolean.get_physical_type(),
+            data: values.iter().map(|&b| b as u8).collect(),
+            validity: ValidityMask::all_valid(values.len()),
+            selection: None,
+            count: values.len(),
+            capacity: values.len(),
+        }
+    }
+
     /// Get the logical type of this vector
     pub fn get_type(&self) -> &LogicalType {
         &self.logical_type
@@ -859,6 +872,49 @@ impl Vector {
         }
     }
 
+    /// Get the bytes of every string in a VARCHAR vector in one pass
+    ///
+    /// `get_value` locates a string by skipping all strings stored before it,
+    /// so reading a whole column through it is quadratic. This walks the
+    /// packed buffer once instead. Returns one entry per row, `None` for NULL
+    /// rows, or `None` overall if the vector does not hold strings.
+    pub fn string_slices(&self) -> Option<Vec<Option<&[u8]>>> {
+        match self.logical_type {
+            LogicalType::Varchar | LogicalType::Char { .. } => {}
+            _ => return None,
+        }
+
+        let mut slices = Vec::with_capacity(self.count);
+        let mut offset = 0;
+        for i in 0..self.count {
+            if !self.validity.is_valid(i) {
+                slices.push(None);
+                continue;
+            }
+            if offset + 4 > self.data.len() {
+                slices.push(Some(&self.data[0..0]));
+                continue;
+            }
+            let mut len_bytes = [0u8; 4];
+            len_bytes.copy_from_slice(&self.data[offset..offset + 4]);
+            let len = u32::from_le_bytes(len_bytes) as usize;
+            let start = offset + 4;
+            let end = (start + len).min(self.data.len());
+            slices.push(Some(&self.data[start..end]));
+            offset = start + len;
+        }
+        Some(slices)
+    }
+
+    /// Get the raw little-endian storage of a fixed-width vector
+    ///
+    /// Returns `None` for variable-width types such as VARCHAR. The slice
+    /// covers exactly `count` elements; null entries hold unspecified bytes.
+    pub fn fixed_width_data(&self) -> Option<&[u8]> {
+        let element_size = self.physical_type.get_size()?;
+        self.data.get(..element_size * self.count)
+    }
+
     /// Get the validity mask
     pub fn get_validity(&self) -> &ValidityMask {
         &self.validity
@@ -1008,6 +1064,53 @@ impl<'a> Iterator for VectorIterator<'a> {
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_fixed_width_data() -> PrismDBResult<()> {
+        let mut vector = Vector::new(LogicalType::BigInt, 4);
+        vector.push(&Value::BigInt(7))?;
+        vector.push(&Value::BigInt(-1))?;
+
+        let data = vector.fixed_width_data().unwrap();
+        assert_eq!(data.len(), 16);
+        assert_eq!(&data[..8], &7i64.to_le_bytes());
+        assert_eq!(&data[8..], &(-1i64).to_le_bytes());
+
+        let varchar = Vector::new(LogicalType::Varchar, 4);
+        assert!(varchar.fixed_width_data().is_none());
+        Ok(())
+    }
+
+    #[test]
+    fn test_from_booleans() -> PrismDBResult<()> {
+        let vector = Vector::from_booleans(&[true, false, true]);
+        assert_eq!(vector.get_type(), &LogicalType::Boolean);
+        assert_eq!(vector.len(), 3);
+        assert_eq!(vector.null_count(), 0);
+        assert_eq!(vector.get_value(0)?, Value::Boolean(true));
+        assert_eq!(vector.get_value(1)?, Value::Boolean(false));
+        assert_eq!(vector.get_value(2)?, Value::Boolean(true));
+        Ok(())
+    }
+
+    #[test]
+    fn test_string_slices() -> PrismDBResult<()> {
+        let mut vector = Vector::new(LogicalType::Varchar, 4);
+        vector.push(&Value::Varchar("North".to_string()))?;
+        vector.push(&Value::Null)?;
+        vector.push(&Value::Varchar(String::new()))?;
+        vector.push(&Value::Varchar("South".to_string()))?;
+
+        let slices = vector.string_slices().unwrap();
+        assert_eq!(
+            slices,
+            vec![Some(&b"North"[..]), None, Some(&b""[..]), Some(&b"South"[..])]
+        );
+
+        let integers = Vector::new(LogicalType::Integer, 4);
+        assert!(integers.string_slices().is_none());
+        Ok(())
+    }
+
     #[test]
     fn test_validity_mask() {
         let mut mask = ValidityMask::new(10);
@@ -3,7 +3,7 @@
 //! These tests provide end-to-end validation of query execution
 //! with proper result verification and edge case testing.
 
-use prism::{Database, PrismDBResult};
+use prism::{Database, DatabaseConfig, PrismDBError, PrismDBResult};
 use prism::types::*;
 // use std::sync::Arc; // Not needed currently
 
@@ -111,6 +111,81 @@ fn test_where_conditions() -> PrismDBResult<()> {
     Ok(())
 }
 
+/// Test that SQL inserts still work after a bulk column load
+#[test]
+fn test_insert_after_append_columns() -> PrismDBResult<()> {
+    let db = Database::new_in_memory()?;
+    db.execute_sql_collect("CREATE TABLE numbers (value INTEGER)")?;
+
+    // Load more rows than the initial table capacity
+    let values: Vec<Value> = (0..2000).map(Value::Integer).collect();
+    assert_eq!(db.append_columns("numbers", vec![values])?, 2000);
+
+    db.execute_sql_collect("INSERT INTO numbers VALUES (2000)")?;
+    db.execute_sql_collect("INSERT INTO numbers VALUES (2001), (2002)")?;
+
+    let result = db.execute_sql_collect("SELECT COUNT(*) FROM numbers")?;
+    assert_eq!(result.first_value(), Some(Value::BigInt(2003)));
+    Ok(())
+}
+
+/// Test that the first value is found past morsels a filter emptied
+#[test]
+fn test_first_value_skips_empty_chunks() -> PrismDBResult<()> {
+    let db = Database::new_in_memory()?;
+    db.execute_sql_collect("CREATE TABLE numbers (value INTEGER)")?;
+
+    // Larger than one scan morsel, with the only match in the last one
+    let values: Vec<Value> = (0..250_000).map(Value::Integer).collect();
+    db.append_columns("numbers", vec![values])?;
+
+    let result = db.execute_sql_collect("SELECT value FROM numbers WHERE value = 249999")?;
+    assert_eq!(result.first_value(), Some(Value::Integer(249999)));
+    Ok(())
+}
+
+/// Test returning a WHERE predicate as a mask over the unfiltered rows
+#[test]
+fn test_execute_bitmap() -> PrismDBResult<()> {
+    let db = create_test_database()?;
+    db.execute_sql_collect("INSERT INTO users VALUES (5, 'Eve', NULL, false)")?;
+
+    let (result, mask) = db.execute_bitmap("SELECT name, age FROM users WHERE age > 25")?;
+    assert_eq!(result.column_count(), 2, "Mask column should not be returned");
+    let collected = result.collect()?;
+    assert_eq!(collected.rows.len(), 5, "All scanned rows should be returned");
+    assert_eq!(mask.len(), 5);
+
+    let selected: Vec<_> = collected
+        .rows
+        .iter()
+        .zip(&mask)
+        .filter(|(_, keep)| **keep)
+        .map(|(row, _)| row[0].clone())
+        .collect();
+    let filtered = db
+        .execute_sql_collect("SELECT name FROM users WHERE age > 25")?
+        .collect()?;
+    let expected: Vec<_> = filtered.rows.iter().map(|row| row[0].clone()).collect();
+    assert_eq!(selected, expected, "NULL predicates should be masked out");
+
+    assert!(db.execute_bitmap("SELECT name FROM users WHERE age > 25 ORDER BY name").is_err());
+
+    // Aggregates and window functions would see the unfiltered rows
+    for sql in [
+        "SELECT COUNT(*) FROM users WHERE age > 25",
+        "SELECT name, ROW_NUMBER() OVER () FROM users WHERE age > 25",
+        "SELECT SUM(age) + 1 AS total FROM users WHERE age > 25",
+    ] {
+        assert!(
+            matches!(db.execute_bitmap(sql), Err(PrismDBError::InvalidArgument(_))),
+            "{} should be rejected",
+            sql
+        );
+    }
+    Ok(())
+}
+
 /// Test LIMIT clause
 #[test]
 fn test_limit_clause() -> PrismDBResult<()> {
@@ -253,6 +328,127 @@ fn test_aggregate_functions() -> PrismDBResult<()> {
     Ok(())
 }
 
+/// Test that COUNT(*) answered from table metadata matches a full scan
+#[test]
+fn test_count_star_shortcut() -> PrismDBResult<()> {
+    let mut db = create_test_database()?;
+
+    let result = db.execute("SELECT COUNT(*) FROM users")?;
+    assert_eq!(result.row_count(), 1);
+    assert_eq!(result.first_value(), Some(Value::BigInt(4)));
+
+    // A filtered count still goes through the executor
+    let result = db.execute("SELECT COUNT(*) FROM users WHERE age > 26")?;
+    assert_eq!(result.first_value(), Some(Value::BigInt(3)));
+
+    // Deleted rows must not be counted
+    db.execute("DELETE FROM users WHERE id = 2")?;
+    let result = db.execute("SELECT COUNT(*) FROM users")?;
+    assert_eq!(result.first_value(), Some(Value::BigInt(3)));
+
+    db.execute("CREATE TABLE empty_table (id INTEGER)")?;
+    let result = db.execute("SELECT COUNT(*) FROM empty_table")?;
+    assert_eq!(result.first_value(), Some(Value::BigInt(0)));
+
+    Ok(())
+}
+
+/// Test that GROUP BY results do not depend on the number of worker threads
+#[test]
+fn test_group_by_thread_counts() -> PrismDBResult<()> {
+    let mut results = Vec::new();
+    for threads in [1, 3] {
+        let mut db = Database::new(DatabaseConfig { threads, ..DatabaseConfig::in_memory() })?;
+        assert_eq!(db.threads(), threads);
+        db.execute("CREATE TABLE t (k INTEGER, v INTEGER)")?;
+
+        // Enough rows to span several chunks
+        for batch in 0..10 {
+            let values: Vec<String> = (0..500)
+                .map(|i| {
+                    let row = batch * 500 + i;
+                    format!("({}, {})", row % 37, row)
+                })
+                .collect();
+            db.execute(&format!("INSERT INTO t VALUES {}", values.join(", ")))?;
+        }
+
+        let collected = db
+            .execute("SELECT k, COUNT(*), MIN(v), MAX(v) FROM t GROUP BY k ORDER BY k")?
+            .collect()?;
+        assert_eq!(collected.rows.len(), 37);
+        let total: i64 = collected
+            .rows
+            .iter()
+            .map(|row| match row[1] {
+                Value::BigInt(count) => count,
+                ref other => panic!("unexpected COUNT(*) value {:?}", other),
+            })
+            .sum();
+        assert_eq!(total, 5000);
+        results.push(collected.rows);
+    }
+    assert_eq!(results[0], results[1]);
+
+    assert!(Database::new(DatabaseConfig { threads: 0, ..DatabaseConfig::in_memory() }).is_err());
+    Ok(())
+}
+
+/// Test that aggregates sharing an argument match the same aggregates computed alone
+#[test]
+fn test_aggregates_sharing_an_argument() -> PrismDBResult<()> {
+    let mut db = create_test_database()?;
+
+    let combined = db
+        .execute("
+            SELECT user_id, COUNT(*), SUM(amount), AVG(amount), MAX(amount)
+            FROM orders
+            GROUP BY user_id
+            ORDER BY user_id
+        ")?
+        .collect()?;
+    assert!(!combined.rows.is_empty());
+
+    for (col_idx, aggregate) in ["COUNT(*)", "SUM(amount)", "AVG(amount)", "MAX(amount)"].iter().enumerate() {
+        let alone = db
+            .execute(&format!(
+                "SELECT user_id, {} FROM orders GROUP BY user_id ORDER BY user_id",
+                aggregate
+            ))?
+            .collect()?;
+        assert_eq!(alone.rows.len(), combined.rows.len());
+        for (alone_row, combined_row) in alone.rows.iter().zip(&combined.rows) {
+            assert_eq!(alone_row[1], combined_row[col_idx + 1], "{} differs", aggregate);
+        }
+    }
+
+    Ok(())
+}
+
+/// Test that aggregates over different expressions of the same shape are not merged
+#[test]
+fn test_aggregates_over_distinct_case_arguments() -> PrismDBResult<()> {
+    let mut db = create_test_database()?;
+
+    let result = db
+        .execute("
+            SELECT
+                SUM(CASE WHEN age > 26 THEN age ELSE 0 END),
+                SUM(CASE WHEN id < 3 THEN id ELSE 0 END)
+            FROM users
+        ")?
+        .collect()?;
+    assert_eq!(result.rows.len(), 1);
+
+    // Ages over 26: 30 + 35 + 28; ids under 3: 1 + 2
+    let row = &result.rows[0];
+    assert_ne!(row[0], row[1], "Different CASE arguments must not share a slot");
+    assert_eq!(row[0].to_string(), "93");
+    assert_eq!(row[1].to_string(), "3");
+
+    Ok(())
+}
+
 /// Test GROUP BY with HAVING
 #[test]
 fn test_group_by_having() -> PrismDBResult<()> {
@@ -0,0 +1,57 @@
+//! Tests for positional `?` parameter binding and batched execution
+
+use prism::database::Database;
+use prism::parser::{LiteralValue, QueryParameters};
+use prism::{PrismDBResult, Value};
+
+fn params(values: Vec<LiteralValue>) -> QueryParameters {
+    let mut params = QueryParameters::new();
+    for (index, value) in values.into_iter().enumerate() {
+        params.set_parameter(index, value);
+    }
+    params
+}
+
+#[test]
+fn test_parameter_count() -> PrismDBResult<()> {
+    let db = Database::new_in_memory()?;
+    let statements = db.parse_sql("INSERT INTO users VALUES (?, ?, ?)")?;
+    assert_eq!(statements[0].parameter_count(), 3);
+
+    let statements = db.parse_sql("SELECT * FROM users WHERE id > ? AND age < ?")?;
+    assert_eq!(statements[0].parameter_count(), 2);
+    Ok(())
+}
+
+#[test]
+fn test_batch_insert_with_parameters() -> PrismDBResult<()> {
+    let db = Database::new_in_memory()?;
+    db.execute_sql_collect("CREATE TABLE users (id INTEGER, name VARCHAR)")?;
+
+    let statement = db.parse_sql("INSERT INTO users VALUES (?, ?)")?.remove(0);
+    let param_sets = vec![
+        params(vec![LiteralValue::Integer(1), LiteralValue::String("Alice".to_string())]),
+        params(vec![LiteralValue::Integer(2), LiteralValue::String("O'Brien".to_string())]),
+        params(vec![LiteralValue::Integer(3), LiteralValue::Null]),
+    ];
+    db.execute_statement_batch(&statement, &param_sets)?;
+
+    let result = db.execute_sql_collect("SELECT COUNT(*) FROM users")?;
+    assert_eq!(result.first_value(), Some(Value::BigInt(3)));
+
+    let statement = db.parse_sql("SELECT name FROM users WHERE id = ?")?.remove(0);
+    let bound = statement.bind_parameters(&params(vec![LiteralValue::Integer(2)]))?;
+    let result = db.execute_statement(&bound)?;
+    assert_eq!(result.first_value(), Some(Value::Varchar("O'Brien".to_string())));
+    Ok(())
+}
+
+#[test]
+fn test_missing_parameter_is_an_error() -> PrismDBResult<()> {
+    let db = Database::new_in_memory()?;
+    let statement = db.parse_sql("SELECT ? + ?")?.remove(0);
+    assert!(statement
+        .bind_parameters(&params(vec![LiteralValue::Integer(1)]))
+        .is_err());
+    Ok(())
+}
@@ -453,12 +453,11 @@ fn test_error_handling_and_edge_cases() -> PrismDBResult<()> {
     
     let mut table = TableData::new(table_info, 2)?; // Small capacity
     
-    // Test capacity exceeded
+    // Inserting past the initial capacity grows the table
     table.insert_row(&[Value::Integer(1)])?;
     table.insert_row(&[Value::Integer(2)])?;
-    
-    let result = table.insert_row(&[Value::Integer(3)]);
-    assert!(result.is_err());
+    table.insert_row(&[Value::Integer(3)])?;
+    assert_eq!(table.row_count(), 3);
     
     // Test invalid row ID
     let result = table.get_row(10);